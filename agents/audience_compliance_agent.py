@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class AudienceComplianceInput(BaseModel):
@@ -51,7 +50,7 @@ class AudienceComplianceAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {
             "compliance_status": data.get("compliance_status", ""),
             "compliance_violations": data.get("compliance_violations", []),
@@ -10,6 +10,34 @@ from typing import Any
 
 from pydantic import BaseModel
 
+try:  # optional: faster decoding for agent responses (pip install ".[fast]")
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def loads_json(text: str | bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+
+    orjson is stricter than ``json`` (it rejects ``NaN``/``Infinity`` and
+    lone surrogate escapes), so anything it refuses is retried with
+    ``json.loads``. Accepted input is therefore the same either way, and
+    invalid input raises ``json.JSONDecodeError``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+class _SafeFormatDict(dict):
+    """format_map mapping that leaves unknown {placeholders} in place."""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
 
 def repair_json(text: str) -> str:
     """Fix common JSON errors produced by LLMs via single-pass state machine.
@@ -191,10 +219,10 @@ class BaseAgent(ABC):
 
     def build_prompt(self, state: dict[str, Any]) -> tuple[str, str]:
         """Return (system_prompt, user_message) from current state."""
-        safe = {k: (str(v) if not isinstance(v, str) else v) for k, v in state.items()}
-        return self.SYSTEM_PROMPT, self.USER_TEMPLATE.format_map(
-            type("_SafeDict", (dict,), {"__missing__": lambda s, k: f"{{{k}}}"})(**safe)
+        safe = _SafeFormatDict(
+            (k, v if isinstance(v, str) else str(v)) for k, v in state.items()
         )
+        return self.SYSTEM_PROMPT, self.USER_TEMPLATE.format_map(safe)
 
     @abstractmethod
     def parse(self, response: str) -> dict[str, Any]:
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 VALID_CLAIM_TYPES = ("canon_fact", "world_rule", "character_trait", "event", "belief", "legend")
+# Set forms for the per-claim membership checks in validate()
+_VALID_CLAIM_TYPE_SET = frozenset(VALID_CLAIM_TYPES)
+_UNCITED_CLAIM_TYPES = frozenset(("belief", "legend"))
 
 
 class CanonUpdaterInput(BaseModel):
@@ -73,7 +75,7 @@ class CanonUpdaterAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {
             "new_claims": data.get("new_claims", []),
             "updated_characters": data.get("updated_characters", []),
@@ -92,7 +94,9 @@ class CanonUpdaterAgent(BaseAgent):
             if not c.get("statement"):
                 raise ValueError(f"Claim {c.get('claim_id')} has no statement")
             ct = c.get("claim_type")
-            if ct not in VALID_CLAIM_TYPES:
+            # isinstance guard: an unhashable claim_type from a malformed
+            # response must still surface as ValueError, not TypeError.
+            if not isinstance(ct, str) or ct not in _VALID_CLAIM_TYPE_SET:
                 raise ValueError(
                     f"Claim {c.get('claim_id')} has invalid claim_type: {ct!r}. "
                     f"Must be one of {VALID_CLAIM_TYPES}"
@@ -100,7 +104,7 @@ class CanonUpdaterAgent(BaseAgent):
             # Claims without citations are reclassified as beliefs/legends
             # rather than hard-failing — they become future plot hooks
             citations = c.get("citations", [])
-            if not citations and ct not in ("belief", "legend"):
+            if not citations and ct not in _UNCITED_CLAIM_TYPES:
                 c["claim_type"] = "belief"
                 c.setdefault("_note", "Auto-reclassified: no citation provided")
 
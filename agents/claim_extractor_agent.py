@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class ClaimExtractorInput(BaseModel):
@@ -48,7 +47,7 @@ class ClaimExtractorAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {"claims": data.get("claims", [])}
 
     def validate(self, output: dict[str, Any]) -> None:
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class ContradictionInput(BaseModel):
@@ -49,7 +48,7 @@ class ContradictionAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {
             "contradictions": data.get("contradictions", []),
             "updated_claim_ids": data.get("updated_claim_ids", []),
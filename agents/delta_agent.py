@@ -10,7 +10,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class DeltaInput(BaseModel):
@@ -42,7 +42,7 @@ class DeltaAgent(BaseAgent):
         return result
 
     def parse(self, response: str) -> dict[str, Any]:
-        return json.loads(response)
+        return loads_json(response)
 
     def validate(self, output: dict[str, Any]) -> None:
         if not output.get("snapshot_id"):
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class EntityResolverInput(BaseModel):
@@ -45,7 +44,7 @@ class EntityResolverAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {
             "entities": data.get("entities", []),
             "relationships": data.get("relationships", []),
@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
+
+
+def _content_hash(text: str) -> str:
+    """SHA-256 of the UTF-8 text, matching the connectors' content_hash."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _chunk_paragraphs(text: str, max_chars: int) -> list[str]:
+    """Group paragraphs into chunks of roughly max_chars."""
+    chunks: list[str] = []
+    current_chunk: list[str] = []
+    current_len = 0
+
+    for para in text.split("\n\n"):
+        if current_len + len(para) > max_chars and current_chunk:
+            chunks.append("\n\n".join(current_chunk))
+            current_chunk = []
+            current_len = 0
+        current_chunk.append(para)
+        current_len += len(para)
+
+    if current_chunk:
+        chunks.append("\n\n".join(current_chunk))
+
+    return chunks
 
 
 class IngestorInput(BaseModel):
@@ -45,7 +69,7 @@ class IngestorAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {
             "doc_ids": data.get("doc_ids", []),
             "segment_ids": data.get("segment_ids", []),
@@ -68,7 +92,7 @@ class IngestorAgent(BaseAgent):
     ) -> dict[str, Any]:
         """Helper to build a source_doc record outside of LLM flow."""
         now = datetime.now(timezone.utc).isoformat()
-        content_hash = hashlib.sha256(text.encode()).hexdigest()
+        content_hash = _content_hash(text)
         return {
             "doc_id": str(uuid.uuid4()),
             "uri": uri,
@@ -82,32 +106,12 @@ class IngestorAgent(BaseAgent):
     @staticmethod
     def segment_text(doc_id: str, text: str, max_chars: int = 2000) -> list[dict[str, Any]]:
         """Split text into segments of roughly max_chars, breaking on paragraph boundaries."""
-        paragraphs = text.split("\n\n")
-        segments: list[dict[str, Any]] = []
-        current_chunk: list[str] = []
-        current_len = 0
-        idx = 0
-
-        for para in paragraphs:
-            if current_len + len(para) > max_chars and current_chunk:
-                segments.append({
-                    "segment_id": str(uuid.uuid4()),
-                    "doc_id": doc_id,
-                    "idx": idx,
-                    "text": "\n\n".join(current_chunk),
-                })
-                idx += 1
-                current_chunk = []
-                current_len = 0
-            current_chunk.append(para)
-            current_len += len(para)
-
-        if current_chunk:
-            segments.append({
+        return [
+            {
                 "segment_id": str(uuid.uuid4()),
                 "doc_id": doc_id,
                 "idx": idx,
-                "text": "\n\n".join(current_chunk),
-            })
-
-        return segments
+                "text": chunk,
+            }
+            for idx, chunk in enumerate(_chunk_paragraphs(text, max_chars))
+        ]
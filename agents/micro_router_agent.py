@@ -6,12 +6,11 @@ structured classification.  Outputs a JSON routing decision.
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class MicroRouterInput(BaseModel):
@@ -69,7 +68,7 @@ class MicroRouterAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {
             "intent": str(data.get("intent", "")),
             "requires_reasoning": bool(data.get("requires_reasoning", False)),
@@ -7,7 +7,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class NarrationFormatterInput(BaseModel):
@@ -59,7 +59,7 @@ class NarrationFormatterAgent(BaseAgent):
 
     def parse(self, response: str) -> dict[str, Any]:
         try:
-            data = json.loads(response)
+            data = loads_json(response)
             return {
                 "narration_script": data.get("narration_script", ""),
                 "recap": data.get("recap", ""),
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
+
+# Compiled once for normalize_text
+_TAG_RE = re.compile(r"<[^>]+>")
+_UNICODE_WS_RE = re.compile(r"[\xa0\u200b\u200c\u200d\ufeff]")
+_WS_RE = re.compile(r"[ \t]+")
+_NL_RE = re.compile(r"\n{3,}")
 
 
 class NormalizerInput(BaseModel):
@@ -41,7 +46,7 @@ class NormalizerAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {"normalized_segments": data.get("normalized_segments", [])}
 
     def validate(self, output: dict[str, Any]) -> None:
@@ -55,11 +60,12 @@ class NormalizerAgent(BaseAgent):
     @staticmethod
     def normalize_text(text: str) -> str:
         """Deterministic text cleanup (no LLM needed)."""
-        # Strip HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        # Strip HTML tags; the substring check skips the regex for plain text
+        if "<" in text:
+            text = _TAG_RE.sub("", text)
         # Normalize unicode whitespace
-        text = re.sub(r"[\xa0\u200b\u200c\u200d\ufeff]", " ", text)
+        text = _UNICODE_WS_RE.sub(" ", text)
         # Collapse multiple whitespace/newlines
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _WS_RE.sub(" ", text)
+        text = _NL_RE.sub("\n\n", text)
         return text.strip()
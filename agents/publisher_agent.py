@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,23 +12,29 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 PUBLISH_ROOT = Path("publish/out")
 
 
+_SEMVER_DIR_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+
 def _next_semver(publish_root: Path, scope_type: str, scope_id: str) -> str:
     """Compute next semver for certification publishes (e.g. 1.0.0 → 1.1.0)."""
-    base = publish_root / scope_type / scope_id
-    if not base.exists():
-        return "1.0.0"
-    existing = []
-    for d in base.iterdir():
-        if d.is_dir() and re.match(r"^\d+\.\d+\.\d+$", d.name):
-            existing.append(tuple(int(x) for x in d.name.split(".")))
-    if not existing:
+    latest: tuple[int, int, int] | None = None
+    try:
+        with os.scandir(publish_root / scope_type / scope_id) as entries:
+            for entry in entries:
+                m = _SEMVER_DIR_RE.fullmatch(entry.name)
+                if m and entry.is_dir():
+                    version = (int(m[1]), int(m[2]), int(m[3]))
+                    if latest is None or version > latest:
+                        latest = version
+    except FileNotFoundError:
+        pass
+    if latest is None:
         return "1.0.0"
-    latest = max(existing)
     return f"{latest[0]}.{latest[1] + 1}.0"
 
 
@@ -93,7 +100,7 @@ class PublisherAgent(BaseAgent):
         return result
 
     def parse(self, response: str) -> dict[str, Any]:
-        return json.loads(response)
+        return loads_json(response)
 
     def validate(self, output: dict[str, Any]) -> None:
         if not output.get("publish_dir"):
@@ -126,7 +133,7 @@ class PublisherAgent(BaseAgent):
                         break
 
         # Determine version label
-        version = state.get("version") or auto_version(scope_type, state)
+        version = state.get("version") or auto_version(scope_type, state, PUBLISH_ROOT)
         publish_dir = PUBLISH_ROOT / scope_type / scope_id / version
         publish_dir.mkdir(parents=True, exist_ok=True)
 
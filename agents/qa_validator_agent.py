@@ -5,7 +5,6 @@ Supports global rules plus domain-specific gates for cert, dossier, and lab.
 
 from __future__ import annotations
 
-import json
 import logging
 import math
 from typing import Any
@@ -14,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class QAValidatorInput(BaseModel):
@@ -50,7 +49,7 @@ class QAValidatorAgent(BaseAgent):
         return result
 
     def parse(self, response: str) -> dict[str, Any]:
-        return json.loads(response)
+        return loads_json(response)
 
     def validate(self, output: dict[str, Any]) -> None:
         if output.get("gate_status") not in ("PASS", "FAIL"):
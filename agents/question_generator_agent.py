@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class QuestionGeneratorInput(BaseModel):
@@ -56,7 +55,7 @@ class QuestionGeneratorAgent(BaseAgent):
     VALID_QTYPES = {"multiple_choice", "true_false", "short_answer", "scenario"}
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         return {"questions": data.get("questions", [])}
 
     def validate(self, output: dict[str, Any]) -> None:
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 
 
 class SceneWriterInput(BaseModel):
@@ -58,7 +57,7 @@ class SceneWriterAgent(BaseAgent):
     )
 
     def parse(self, response: str) -> dict[str, Any]:
-        data = json.loads(response)
+        data = loads_json(response)
         scenes = data.get("scenes", [])
         episode_text = data.get("episode_text", "")
         # Compute episode_text from scenes when missing (e.g. truncated output)
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent
+from agents.base_agent import AgentPolicy, BaseAgent, loads_json
 from data.dao_story_worlds import get_world
 from data.dao_characters import get_characters_for_world
 from data.dao_threads import get_open_threads
@@ -69,7 +68,7 @@ class StoryMemoryLoaderAgent(BaseAgent):
         return result
 
     def parse(self, response: str) -> dict[str, Any]:
-        return json.loads(response)
+        return loads_json(response)
 
     def validate(self, output: dict[str, Any]) -> None:
         if not isinstance(output.get("world_state"), dict):
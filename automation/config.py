@@ -25,6 +25,20 @@ class PathsConfig:
     logs: str = "automation/logs"
     schemas: str = "automation/schemas"
 
+    @classmethod
+    def from_base(cls, base: str | Path) -> PathsConfig:
+        """Lay out every directory directly under *base*."""
+        base = Path(base)
+        return cls(
+            base=str(base),
+            tasks=str(base / "tasks"),
+            processing=str(base / "processing"),
+            outputs=str(base / "outputs"),
+            archive=str(base / "archive"),
+            logs=str(base / "logs"),
+            schemas=str(base / "schemas"),
+        )
+
 
 @dataclass
 class ValidationConfig:
@@ -11,6 +11,11 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:  # optional: faster log serialisation (pip install ".[fast]")
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
 from automation.config import AutomationConfig
 
 # Recognised action verbs
@@ -26,6 +31,11 @@ ACTIONS = {
 }
 
 
+def _now() -> str:
+    """UTC timestamp for log entries; tests patch this for fixed values."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
 def log_path(cfg: AutomationConfig) -> Path:
     """Return the path to the structured log file, creating dirs if needed."""
     logs_dir = Path(cfg.paths.logs)
@@ -33,6 +43,23 @@ def log_path(cfg: AutomationConfig) -> Path:
     return logs_dir / "system.log"
 
 
+def make_entry(
+    *,
+    action: str,
+    status: str = "ok",
+    task_id: str = "",
+    details: str = "",
+) -> dict:
+    """Build a structured log entry without writing it."""
+    return {
+        "timestamp": _now(),
+        "task_id": task_id,
+        "action": action,
+        "status": status,
+        "details": details,
+    }
+
+
 def log_event(
     cfg: AutomationConfig,
     *,
@@ -50,18 +77,35 @@ def log_event(
         task_id: Related task ID (empty string if N/A).
         details: Free-text description.
     """
-    entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-        "task_id": task_id,
-        "action": action,
-        "status": status,
-        "details": details,
-    }
-    with open(log_path(cfg), "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    entry = make_entry(action=action, status=status, task_id=task_id, details=details)
+    log_events(cfg, [entry])
     return entry
 
 
+def log_events(cfg: AutomationConfig, entries: list[dict]) -> None:
+    """Append several entries with a single open and write."""
+    if not entries:
+        return
+    buf = b"".join(_dumps_line(e) for e in entries)
+    with open(log_path(cfg), "ab") as f:
+        f.write(buf)
+
+
+def _dumps_line(entry: dict) -> bytes:
+    """Serialise one entry as a newline-terminated JSON line.
+
+    orjson refuses strings holding lone surrogates (e.g. non-UTF-8 file
+    names decoded via ``os.fsdecode``); ``json.dumps`` escapes them, so it
+    is the fallback.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry) + b"\n"
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(entry) + "\n").encode("ascii")
+
+
 def read_log(cfg: AutomationConfig) -> list[dict]:
     """Read all log entries from the structured log file."""
     lp = log_path(cfg)
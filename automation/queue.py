@@ -11,6 +11,11 @@ import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:  # optional: faster queue (de)serialisation (pip install ".[fast]")
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
 
 @dataclass
 class QueueState:
@@ -25,7 +30,15 @@ class QueueState:
 def load_queue(path: str | Path) -> QueueState:
     """Load queue state from a JSON file."""
     path = Path(path)
-    raw = json.loads(path.read_text())
+    data = path.read_bytes()
+    raw = None
+    if orjson is not None:
+        try:
+            raw = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. escaped lone surrogates, which json accepts
+    if raw is None:
+        raw = json.loads(data)
     return QueueState(
         pending=raw.get("pending", []),
         processing=raw.get("processing", []),
@@ -50,10 +63,24 @@ def save_queue(path: str | Path, state: QueueState) -> None:
         "failed": state.failed,
         "parents": state.parents,
     }
-    tmp_path.write_text(json.dumps(data, indent=2))
+    tmp_path.write_bytes(_dumps(data))
     os.replace(tmp_path, path)
 
 
+def _dumps(data: dict) -> bytes:
+    """Serialise queue data, indented by two spaces.
+
+    orjson refuses strings holding lone surrogates (e.g. task IDs taken from
+    non-UTF-8 file names); ``json.dumps`` escapes them, so it is the fallback.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2).encode("ascii")
+
+
 def add_pending(state: QueueState, task_id: str) -> None:
     """Add a task to the pending list.  Raises if already present anywhere."""
     _assert_not_present(state, task_id)
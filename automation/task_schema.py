@@ -6,6 +6,7 @@ for content.  This module parses them into typed dataclasses.
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from datetime import date, datetime
@@ -145,18 +146,24 @@ def generate_task_id(tasks_dir: str | Path) -> str:
     Scans *tasks_dir* for existing files matching today's date prefix and
     increments the sequence number.
     """
-    tasks_dir = Path(tasks_dir)
     today = date.today().isoformat()  # e.g. "2026-02-17"
     prefix = today + "-"
 
-    existing: list[int] = []
-    if tasks_dir.exists():
-        for p in tasks_dir.iterdir():
-            name = p.stem  # filename without extension
-            if name.startswith(prefix):
-                seq_str = name[len(prefix):]
+    # scandir yields bare names, so the prefix test runs without a stat or
+    # Path object per entry.
+    max_seq = 0
+    try:
+        with os.scandir(tasks_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix):
+                    continue
+                stem = name.rpartition(".")[0] or name  # same as Path.stem
+                seq_str = stem[len(prefix):]
                 if seq_str.isdigit():
-                    existing.append(int(seq_str))
+                    max_seq = max(max_seq, int(seq_str))
+    except FileNotFoundError:
+        pass
 
-    next_seq = max(existing, default=0) + 1
+    next_seq = max_seq + 1
     return f"{today}-{next_seq:03d}"
@@ -43,6 +43,13 @@ class ValidationError:
 RESULT_STATUSES = {"COMPLETE", "FAILED"}
 QUALITY_LEVELS = {"LOW", "MEDIUM", "HIGH"}
 
+# Required ``### Subsection`` headers inside META; "_" may also be written as a space.
+META_SUBSECTIONS = ("Assumptions", "Risks", "Suggested_Followups")
+_META_SUBSECTION_RE = re.compile(
+    r"###\s+(" + "|".join(sub.replace("_", "[_ ]") for sub in META_SUBSECTIONS) + ")",
+    re.IGNORECASE,
+)
+
 # ---------------------------------------------------------------------------
 # Task validation
 # ---------------------------------------------------------------------------
@@ -175,11 +182,13 @@ def validate_result(path: str | Path) -> list[ValidationError]:
     if "META" not in sections:
         errors.append(ValidationError("META", "Missing required section: META"))
     else:
-        meta_text = sections["META"]
-        for sub in ("Assumptions", "Risks", "Suggested_Followups"):
-            # Check for ### subsection header
-            pattern = r"###\s+" + sub.replace("_", "[_ ]")
-            if not re.search(pattern, meta_text, re.IGNORECASE):
+        # One scan collects every subsection present, normalised to UPPER_SNAKE.
+        found = {
+            m.group(1).upper().replace(" ", "_")
+            for m in _META_SUBSECTION_RE.finditer(sections["META"])
+        }
+        for sub in META_SUBSECTIONS:
+            if sub.upper() not in found:
                 errors.append(ValidationError(
                     f"META.{sub}",
                     f"Missing META subsection: {sub}",
@@ -7,13 +7,21 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from automation.config import AutomationConfig, default_config, load_config
-from automation.logging import log_event
-from automation.queue import load_queue, move_to_completed, move_to_failed, save_queue
+from automation.logging import log_events, make_entry
+from automation.queue import (
+    QueueState,
+    load_queue,
+    move_to_completed,
+    move_to_failed,
+    save_queue,
+)
 from automation.task_schema import _HEADER_RE
 from automation.validator import validate_result
 
@@ -25,17 +33,35 @@ def _queue_path(cfg: AutomationConfig) -> Path:
     return Path(cfg.paths.base) / "queue.json"
 
 
-def watch_once(cfg: AutomationConfig) -> list[str]:
-    """Run a single poll cycle.  Returns list of task IDs processed."""
-    outputs_dir = Path(cfg.paths.outputs)
-    if not outputs_dir.exists():
-        return []
+@dataclass
+class WatchResult:
+    """Outcome of one poll: task IDs handled and the queue state after it.
+
+    ``state`` is None when the outputs directory does not exist and the
+    queue was never read.
+    """
+    processed: list[str] = field(default_factory=list)
+    state: QueueState | None = None
+
+
+def watch_once(cfg: AutomationConfig) -> WatchResult:
+    """Run a single poll cycle and return what it processed."""
+    try:
+        with os.scandir(cfg.paths.outputs) as it:
+            result_files = sorted(
+                Path(entry.path) for entry in it
+                if entry.name.endswith(".result.md") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return WatchResult()
 
     state = load_queue(_queue_path(cfg))
     already_done = set(state.completed + state.failed)
     processed: list[str] = []
+    # Log entries are written together at the end of the poll.
+    events: list[dict] = []
 
-    for result_file in sorted(outputs_dir.glob("*.result.md")):
+    for result_file in result_files:
         # Extract task ID from the RESULT_FOR header, fall back to filename
         task_id = _extract_task_id(result_file)
         if not task_id:
@@ -55,14 +81,14 @@ def watch_once(cfg: AutomationConfig) -> list[str]:
 
         if not errors:
             move_to_completed(state, task_id)
-            log_event(cfg, action="task_completed", task_id=task_id,
-                      details=f"Result validated: {result_file.name}")
+            events.append(make_entry(action="task_completed", task_id=task_id,
+                                     details=f"Result validated: {result_file.name}"))
             logger.info("Completed: %s", task_id)
         else:
             move_to_failed(state, task_id)
             error_msgs = "; ".join(f"{e.field}: {e.message}" for e in errors)
-            log_event(cfg, action="validation_failed", task_id=task_id,
-                      status="failed", details=error_msgs)
+            events.append(make_entry(action="validation_failed", task_id=task_id,
+                                     status="failed", details=error_msgs))
             logger.warning("Failed validation: %s — %s", task_id, error_msgs)
 
         processed.append(task_id)
@@ -70,10 +96,11 @@ def watch_once(cfg: AutomationConfig) -> list[str]:
     if processed:
         save_queue(_queue_path(cfg), state)
 
-    log_event(cfg, action="watcher_poll",
-              details=f"Processed {len(processed)} result(s)")
+    events.append(make_entry(action="watcher_poll",
+                             details=f"Processed {len(processed)} result(s)"))
+    log_events(cfg, events)
 
-    return processed
+    return WatchResult(processed=processed, state=state)
 
 
 def watch(cfg: AutomationConfig, *, max_cycles: int = 0) -> None:
@@ -124,7 +151,7 @@ def main(argv: list[str] | None = None) -> int:
     cfg = load_config(cfg_path) if cfg_path.exists() else default_config()
 
     if args.once:
-        processed = watch_once(cfg)
+        processed = watch_once(cfg).processed
         print(f"Processed {len(processed)} result(s): {processed}")
         return 0
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -17,8 +18,11 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive client so repeated Ollama polls reuse the connection.
+_HTTPX_CLIENT = httpx.Client(timeout=3.0)
 
-@dataclass
+
+@dataclass(slots=True)
 class GPUStatus:
     """Snapshot of a GPU's health."""
 
@@ -40,7 +44,7 @@ class GPUStatus:
         return self.vram_usage_pct < 90.0
 
 
-@dataclass
+@dataclass(slots=True)
 class OllamaHealth:
     """Health status for an Ollama instance."""
 
@@ -50,7 +54,7 @@ class OllamaHealth:
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthReport:
     """Aggregate health report for all monitored hardware."""
 
@@ -71,8 +75,36 @@ class HealthReport:
         return self.dgx_spark is not None and self.dgx_spark.reachable
 
 
+# nvidia-smi costs a fork+exec per call; bursts of health checks within
+# this window reuse the last result instead of re-running it.
+NVIDIA_SMI_TTL_SECONDS = 2.0
+
+_smi_cache: dict[str, Any] = {"t": 0.0, "v": None}
+
+
 def check_nvidia_smi() -> GPUStatus | None:
-    """Query nvidia-smi for GPU status. Returns None if not available."""
+    """Query nvidia-smi for GPU status. Returns None if not available.
+
+    Results (including None) are cached for ``NVIDIA_SMI_TTL_SECONDS``;
+    call ``check_nvidia_smi.cache_clear()`` to force a fresh query.
+    """
+    now = time.monotonic()
+    if _smi_cache["t"] and now - _smi_cache["t"] < NVIDIA_SMI_TTL_SECONDS:
+        return _smi_cache["v"]
+    status = _query_nvidia_smi()
+    _smi_cache.update(t=now, v=status)
+    return status
+
+
+def _clear_smi_cache() -> None:
+    _smi_cache.update(t=0.0, v=None)
+
+
+check_nvidia_smi.cache_clear = _clear_smi_cache  # type: ignore[attr-defined]
+
+
+def _query_nvidia_smi() -> GPUStatus | None:
+    """Run nvidia-smi and parse the first GPU line."""
     try:
         result = subprocess.run(
             [
@@ -88,18 +120,18 @@ def check_nvidia_smi() -> GPUStatus | None:
             logger.debug("nvidia-smi failed: %s", result.stderr.strip())
             return None
 
-        line = result.stdout.strip().split("\n")[0]
-        parts = [p.strip() for p in line.split(",")]
-        if len(parts) < 6:
-            return None
+        # Only the first GPU is reported; a short line raises ValueError
+        # on unpacking and is handled below.
+        line = result.stdout.strip().partition("\n")[0]
+        name, total, used, free, util, temp = line.split(",", 5)
 
         return GPUStatus(
-            name=parts[0],
-            vram_total_mb=int(parts[1]),
-            vram_used_mb=int(parts[2]),
-            vram_free_mb=int(parts[3]),
-            utilization_pct=int(parts[4]),
-            temperature_c=int(parts[5]),
+            name=name.strip(),
+            vram_total_mb=int(total),
+            vram_used_mb=int(used),
+            vram_free_mb=int(free),
+            utilization_pct=int(util),
+            temperature_c=int(temp),
         )
     except FileNotFoundError:
         logger.debug("nvidia-smi not found")
@@ -113,7 +145,7 @@ def check_ollama(host: str = "http://localhost:11434", timeout: float = 3.0) ->
     """Check an Ollama instance for reachability and loaded models."""
     health = OllamaHealth(host=host)
     try:
-        resp = httpx.get(f"{host.rstrip('/')}/api/tags", timeout=timeout)
+        resp = _HTTPX_CLIENT.get(f"{host.rstrip('/')}/api/tags", timeout=timeout)
         if resp.status_code == 200:
             health.reachable = True
             data = resp.json()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import operator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
@@ -13,11 +15,14 @@ from agents.base_agent import AgentPolicy
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available; same safe semantics as yaml.safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Type alias for a model callable: (system_prompt, user_message) -> response_text
 ModelCallable = Callable[[str, str], str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoutingDecision:
     model_name: str
     reason: str
@@ -31,7 +36,7 @@ class ModelAdapter(Protocol):
     def call(self, system_prompt: str, user_message: str) -> str: ...
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EscalationCriteria:
     """Thresholds that trigger escalation from local to frontier."""
     min_confidence: float = 0.7
@@ -40,7 +45,7 @@ class EscalationCriteria:
     synthesis_complexity_threshold: float = 0.8
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TierConfig:
     """Configuration for a single inference tier."""
 
@@ -52,7 +57,7 @@ class TierConfig:
     timeout: float = 30.0  # seconds
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProviderConfig:
     """Configuration for a Tier 3 frontier provider."""
 
@@ -67,7 +72,7 @@ class ProviderConfig:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RouterConfig:
     """Full router configuration loaded from YAML."""
 
@@ -77,13 +82,29 @@ class RouterConfig:
     escalation: EscalationCriteria
     provider_selection_strategy: str = "prefer_local"
     daily_frontier_cap: int = 100
+    tier3_providers_by_name: dict[str, ProviderConfig] = field(
+        init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "tier3_providers_by_name", {p.name: p for p in self.tier3_providers},
+        )
+
+    def get_provider(self, name: str) -> ProviderConfig | None:
+        """Return the Tier 3 provider with the given name, or None."""
+        return self.tier3_providers_by_name.get(name)
 
 
 def load_router_config(path: str | Path) -> RouterConfig:
     """Load router configuration from a YAML file."""
     with open(path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YAML_LOADER)
+    return load_router_config_from_dict(raw)
+
 
+def load_router_config_from_dict(raw: dict[str, Any]) -> RouterConfig:
+    """Build a RouterConfig from an already-parsed config mapping."""
     tier1 = TierConfig(**raw["tier1"])
     tier2 = TierConfig(**raw["tier2"])
 
@@ -166,29 +187,37 @@ class ModelRouter:
     ) -> list[str]:
         """Check if escalation criteria are met. Returns list of reasons (empty = no escalation)."""
         reasons: list[str] = []
-        criteria = self.escalation_criteria
+        for key, default, exceeds, threshold, fmt in _escalation_checks(self.escalation_criteria):
+            value = state.get(key, default)
+            if value is not None and exceeds(value, threshold):
+                reasons.append(fmt.format(value=value, threshold=threshold))
+        return reasons
 
-        # Low confidence from prior extraction
-        last_confidence = state.get("_last_confidence")
-        if last_confidence is not None and last_confidence < criteria.min_confidence:
-            reasons.append(f"low confidence ({last_confidence:.2f} < {criteria.min_confidence})")
 
-        # Missing citations detected
-        missing_citations_count = state.get("_missing_citations_count", 0)
-        if missing_citations_count > criteria.max_missing_citations:
-            reasons.append(f"missing citations ({missing_citations_count} > {criteria.max_missing_citations})")
+# (state key, default, comparison, threshold, reason template)
+EscalationCheck = tuple[str, Any, Callable[[Any, Any], bool], float, str]
 
-        # Contradiction ambiguity
-        contradiction_ambiguity = state.get("_contradiction_ambiguity")
-        if contradiction_ambiguity is not None and contradiction_ambiguity > criteria.max_contradiction_ambiguity:
-            reasons.append(f"contradiction ambiguity ({contradiction_ambiguity:.2f})")
 
-        # Synthesis complexity
-        synthesis_complexity = state.get("_synthesis_complexity")
-        if synthesis_complexity is not None and synthesis_complexity > criteria.synthesis_complexity_threshold:
-            reasons.append(f"synthesis complexity ({synthesis_complexity:.2f})")
+@lru_cache(maxsize=16)
+def _escalation_checks(criteria: EscalationCriteria) -> tuple[EscalationCheck, ...]:
+    """Compile escalation criteria into a flat tuple of threshold checks.
 
-        return reasons
+    Cached per criteria instance, so a config reload compiles a fresh set.
+    """
+    return (
+        # Low confidence from prior extraction
+        ("_last_confidence", None, operator.lt, criteria.min_confidence,
+         "low confidence ({value:.2f} < {threshold})"),
+        # Missing citations detected
+        ("_missing_citations_count", 0, operator.gt, criteria.max_missing_citations,
+         "missing citations ({value} > {threshold})"),
+        # Contradiction ambiguity
+        ("_contradiction_ambiguity", None, operator.gt, criteria.max_contradiction_ambiguity,
+         "contradiction ambiguity ({value:.2f})"),
+        # Synthesis complexity
+        ("_synthesis_complexity", None, operator.gt, criteria.synthesis_complexity_threshold,
+         "synthesis complexity ({value:.2f})"),
+    )
 
 
 # --- Module-level convenience functions ---
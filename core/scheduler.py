@@ -6,11 +6,13 @@ dispatches graph runs at the configured intervals.
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
 import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
@@ -18,8 +20,11 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available; same safe semantics as yaml.safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ScheduleEntry:
     """A single scheduled job."""
     name: str
@@ -31,7 +36,7 @@ class ScheduleEntry:
     budget: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScheduleConfig:
     """Full scheduler configuration."""
     entries: list[ScheduleEntry] = field(default_factory=list)
@@ -41,7 +46,7 @@ class ScheduleConfig:
 def load_schedule_config(path: Path | str) -> ScheduleConfig:
     """Load schedule configuration from a YAML file."""
     path = Path(path)
-    raw = yaml.safe_load(path.read_text())
+    raw = yaml.load(path.read_text(), Loader=_YAML_LOADER)
     if not raw:
         return ScheduleConfig()
 
@@ -72,13 +77,27 @@ _CRON_SHORTCUTS = {
     "hourly": "0 * * * *",
 }
 
+# Direct predicates for the shortcuts; equivalent to the expansions above
+# but skip the compiled-field lookup entirely.
+_SHORTCUT_MATCHERS: dict[str, Callable[[datetime], bool]] = {
+    "hourly": lambda dt: dt.minute == 0,
+    "daily": lambda dt: dt.minute == 0 and dt.hour == 0,
+    "weekly": lambda dt: dt.minute == 0 and dt.hour == 0 and dt.weekday() == 0,
+    "monthly": lambda dt: dt.minute == 0 and dt.hour == 0 and dt.day == 1,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_cron_field(field_str: str, min_val: int, max_val: int) -> int:
+    """Parse a single cron field into a bitmask of matching values.
 
-def _parse_cron_field(field_str: str, min_val: int, max_val: int) -> set[int]:
-    """Parse a single cron field into a set of matching values."""
+    Bit ``n`` is set when value ``n`` matches, so membership is
+    ``(mask >> n) & 1``. Cached: schedules reuse a handful of field strings.
+    """
     if field_str == "*":
-        return set(range(min_val, max_val + 1))
+        return ((1 << (max_val + 1)) - 1) ^ ((1 << min_val) - 1)
 
-    values: set[int] = set()
+    mask = 0
 
     for part in field_str.split(","):
         # Handle step: */5 or 1-10/2
@@ -92,45 +111,97 @@ def _parse_cron_field(field_str: str, min_val: int, max_val: int) -> set[int]:
             else:
                 start = int(range_part)
                 end = max_val
-            values.update(range(start, end + 1, step))
+            for v in range(start, end + 1, step):
+                mask |= 1 << v
         elif "-" in part:
             start, end = (int(x) for x in part.split("-", 1))
-            values.update(range(start, end + 1))
+            for v in range(start, end + 1):
+                mask |= 1 << v
         else:
-            values.add(int(part))
+            mask |= 1 << int(part)
 
-    return values
+    return mask
 
 
-def cron_matches(cron_expr: str, dt: datetime) -> bool:
-    """Check if a datetime matches a cron expression.
+# (minute, hour, day_of_month, month, day_of_week) bitmasks
+CronFields = tuple[int, int, int, int, int]
 
-    Format: minute hour day_of_month month day_of_week
-    Supports: *, ranges (1-5), steps (*/15), lists (1,3,5), shortcuts.
-    """
+
+@lru_cache(maxsize=256)
+def _compile_cron(cron_expr: str) -> CronFields:
+    """Parse a 5-field cron expression (or shortcut) into per-field bitmasks."""
     expr = _CRON_SHORTCUTS.get(cron_expr, cron_expr)
     parts = expr.strip().split()
     if len(parts) != 5:
         raise ValueError(f"Invalid cron expression: {cron_expr!r} (need 5 fields)")
 
     minute, hour, dom, month, dow = parts
+    return (
+        _parse_cron_field(minute, 0, 59),
+        _parse_cron_field(hour, 0, 23),
+        _parse_cron_field(dom, 1, 31),
+        _parse_cron_field(month, 1, 12),
+        _parse_cron_field(dow, 0, 6),
+    )
+
+
+def cron_matches(cron_expr: str, dt: datetime) -> bool:
+    """Check if a datetime matches a cron expression.
 
-    if dt.minute not in _parse_cron_field(minute, 0, 59):
+    Format: minute hour day_of_month month day_of_week
+    Supports: *, ranges (1-5), steps (*/15), lists (1,3,5), shortcuts.
+    """
+    shortcut = _SHORTCUT_MATCHERS.get(cron_expr)
+    if shortcut is not None:
+        return shortcut(dt)
+
+    minutes, hours, doms, months, dows = _compile_cron(cron_expr)
+
+    if not (minutes >> dt.minute) & 1:
         return False
-    if dt.hour not in _parse_cron_field(hour, 0, 23):
+    if not (hours >> dt.hour) & 1:
         return False
-    if dt.day not in _parse_cron_field(dom, 1, 31):
+    if not (doms >> dt.day) & 1:
         return False
-    if dt.month not in _parse_cron_field(month, 1, 12):
+    if not (months >> dt.month) & 1:
         return False
     # 0 = Monday in Python, but cron uses 0 = Sunday. Convert.
     cron_dow = (dt.weekday() + 1) % 7  # Python Monday=0 → cron Sunday=0
-    if cron_dow not in _parse_cron_field(dow, 0, 6):
+    if not (dows >> cron_dow) & 1:
         return False
 
     return True
 
 
+# Upper bound on the forward search in next_fire; covers leap-day schedules.
+_NEXT_FIRE_HORIZON = timedelta(days=366 * 4 + 1)
+
+
+def next_fire(cron_expr: str, after: datetime) -> datetime:
+    """Return the first minute at or after *after* that matches *cron_expr*.
+
+    *after* is truncated to the minute, so a time inside a matching minute
+    returns that minute. Non-matching days and hours are skipped whole.
+    Raises ValueError if the expression never fires (e.g. ``0 0 31 2 *``).
+    """
+    minutes, hours, doms, months, dows = _compile_cron(cron_expr)
+    t = after.replace(second=0, microsecond=0)
+    limit = t + _NEXT_FIRE_HORIZON
+
+    while t <= limit:
+        cron_dow = (t.weekday() + 1) % 7
+        if not ((months >> t.month) & (doms >> t.day) & (dows >> cron_dow) & 1):
+            t = t.replace(hour=0, minute=0) + timedelta(days=1)
+        elif not (hours >> t.hour) & 1:
+            t = t.replace(minute=0) + timedelta(hours=1)
+        elif not (minutes >> t.minute) & 1:
+            t += timedelta(minutes=1)
+        else:
+            return t
+
+    raise ValueError(f"Cron expression never fires: {cron_expr!r}")
+
+
 def get_due_entries(config: ScheduleConfig, now: datetime | None = None) -> list[ScheduleEntry]:
     """Return schedule entries that are due to run at the given time."""
     if now is None:
@@ -145,7 +216,7 @@ def get_due_entries(config: ScheduleConfig, now: datetime | None = None) -> list
 # Scheduler loop
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerState:
     """Tracks scheduler execution state."""
     last_check: datetime | None = None
@@ -166,7 +237,8 @@ def run_scheduler(
     Args:
         config: Schedule configuration.
         dispatch_fn: Called for each due entry to execute the graph run.
-        check_interval_seconds: How often to check for due entries.
+        check_interval_seconds: Longest sleep between checks; the loop wakes
+            earlier when the next entry is due sooner.
         max_iterations: Stop after N iterations (0 = run forever).
         on_error: Optional error handler.
 
@@ -176,13 +248,33 @@ def run_scheduler(
     state = SchedulerState()
     iteration = 0
 
+    # Min-heap of (next fire time, config position, entry): each check only
+    # pops the entries that are due instead of re-matching every entry.
+    # The position breaks ties so same-minute entries run in config order.
+    heap: list[tuple[datetime, int, ScheduleEntry]] = []
+
+    def _push(pos: int, entry: ScheduleEntry, after: datetime) -> None:
+        # A valid but impossible cron (e.g. Feb 30) never fires; drop that
+        # entry rather than letting it stop every other schedule.
+        try:
+            heapq.heappush(heap, (next_fire(entry.cron, after), pos, entry))
+        except ValueError as exc:
+            err_msg = f"Schedule '{entry.name}' dropped: {exc}"
+            logger.error(err_msg)
+            state.errors.append(err_msg)
+
+    start = datetime.now(timezone.utc)
+    for pos, entry in enumerate(config.entries):
+        if entry.enabled:
+            _push(pos, entry, start)
+
     while True:
         iteration += 1
         now = datetime.now(timezone.utc)
         state.last_check = now
 
-        due = get_due_entries(config, now)
-        for entry in due:
+        while heap and heap[0][0] <= now:
+            fire_at, pos, entry = heapq.heappop(heap)
             try:
                 logger.info("Dispatching scheduled run: %s (%s/%s)",
                             entry.name, entry.graph, entry.scope_id)
@@ -194,10 +286,17 @@ def run_scheduler(
                 state.errors.append(err_msg)
                 if on_error:
                     on_error(entry, exc)
+            # Fires missed while dispatching are skipped, not replayed.
+            after = max(fire_at + timedelta(minutes=1), datetime.now(timezone.utc))
+            _push(pos, entry, after)
 
         if max_iterations and iteration >= max_iterations:
             break
 
-        time.sleep(check_interval_seconds)
+        delay = float(check_interval_seconds)
+        if heap:
+            until_next = (heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+            delay = min(delay, max(until_next, 0.0))
+        time.sleep(delay)
 
     return state
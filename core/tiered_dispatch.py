@@ -18,6 +18,7 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
+from agents.base_agent import loads_json
 from core.command_registry import CommandRegistry
 from core.logging import get_metrics_collector
 from core.routing import ModelRouter, compute_routing_score, DEFAULT_ROUTING_THRESHOLD
@@ -37,7 +38,9 @@ DEFAULT_MAX_INPUT_LENGTH = 10_000
 DEFAULT_TIER1_TIMEOUT = 5.0   # seconds
 DEFAULT_TIER2_TIMEOUT = 30.0  # seconds
 
-# Patterns that indicate prompt injection attempts
+# Patterns that indicate prompt injection attempts. IGNORECASE on str
+# patterns also folds Unicode case variants (e.g. "ſ" -> "s", "ı" -> "i"),
+# which lowercasing the input alone does not.
 _INJECTION_PATTERNS = [
     re.compile(r"ignore\s+(all\s+)?previous\s+instructions", re.IGNORECASE),
     re.compile(r"disregard\s+(all\s+)?prior\s+instructions", re.IGNORECASE),
@@ -46,6 +49,44 @@ _INJECTION_PATTERNS = [
     re.compile(r"<\s*/?\s*system\s*>", re.IGNORECASE),
 ]
 
+# Literal substrings at least one of which every pattern above requires.
+# Lowercased ASCII input containing none of them cannot match, so benign
+# requests skip the regex engine after a few substring searches. Only
+# valid for ASCII input. Keep in sync with the patterns when adding new ones.
+_INJECTION_ANCHORS = ("instructions", "you", "system")
+
+# All patterns fused into one bytes regex: the triggers are pure ASCII, so
+# ASCII input is scanned in a single pass over a compact buffer.
+# Each alternative is a named group so the matching pattern can be reported.
+# IGNORECASE keeps it correct on raw (not lowercased) text.
+_INJECTION_RE = re.compile(
+    b"|".join(
+        b"(?P<p%d>%s)" % (i, p.pattern.encode("ascii"))
+        for i, p in enumerate(_INJECTION_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _scan_injection(text: str) -> str | None:
+    """Scan *text* for injection patterns; returns the reason or None."""
+    if not text.isascii():
+        # Bytes \s only covers ASCII whitespace, and only the str patterns
+        # fold non-ASCII case variants ("ſystem".lower() contains no
+        # "system"), so skip the anchor shortcut and scan the original text.
+        for pattern in _INJECTION_PATTERNS:
+            if pattern.search(text):
+                return f"injection pattern: {pattern.pattern}"
+        return None
+    lowered = text.lower()
+    if not any(anchor in lowered for anchor in _INJECTION_ANCHORS):
+        return None
+    m = _INJECTION_RE.search(text.encode("ascii"))
+    if m is None:
+        return None
+    pattern = _INJECTION_PATTERNS[int(m.lastgroup[1:])]
+    return f"injection pattern: {pattern.pattern}"
+
 
 @dataclass
 class DispatchResult:
@@ -186,19 +227,19 @@ class TieredDispatcher:
     @staticmethod
     def detect_injection(text: str) -> str | None:
         """Check for prompt injection patterns. Returns reason if detected, else None."""
-        for pattern in _INJECTION_PATTERNS:
-            if pattern.search(text):
-                return f"injection pattern: {pattern.pattern}"
-        return None
+        return _scan_injection(text)
 
     def sanitize_input(self, request: str) -> tuple[str, str | None]:
         """Sanitize input: enforce max length and check for injection.
 
+        The length check runs first so oversized input is rejected before
+        any lowercasing or pattern scanning.
+
         Returns (sanitized_text, rejection_reason_or_None).
         """
         if len(request) > self.max_input_length:
             return "", f"input exceeds max length ({len(request)} > {self.max_input_length})"
-        injection = self.detect_injection(request)
+        injection = _scan_injection(request)
         if injection:
             return "", injection
         return request.strip(), None
@@ -415,7 +456,7 @@ class TieredDispatcher:
             raw_response = self._call_with_timeout(
                 self.tier2_model_call, (system_prompt, user_message), self.tier2_timeout,
             )
-            data = json.loads(raw_response)
+            data = loads_json(raw_response)
         except (concurrent.futures.TimeoutError, TimeoutError):
             logger.warning("Tier 2 reasoning timed out (%.1fs), escalating", self.tier2_timeout)
             return None
@@ -26,6 +26,7 @@ def insert_character(
     beliefs: list[str] | None = None,
     voice_notes: str = "",
     meta: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> None:
     if arc_stage not in VALID_ARC_STAGES:
         raise ValueError(f"Invalid arc_stage: {arc_stage!r}")
@@ -44,7 +45,8 @@ def insert_character(
             json.dumps(meta or {}),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_characters_for_world(
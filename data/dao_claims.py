@@ -26,6 +26,7 @@ def insert_claim(
     last_confirmed_at: str | None = None,
     supersedes: list | None = None,
     meta: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> None:
     conn.execute(
         """INSERT INTO claims
@@ -41,7 +42,8 @@ def insert_claim(
             json.dumps(supersedes or []), json.dumps(meta or {}),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_claim(conn: sqlite3.Connection, claim_id: str) -> dict[str, Any] | None:
@@ -18,6 +18,7 @@ def insert_snapshot(
     included_claim_ids: list[str] | None = None,
     included_metric_ids: list[str] | None = None,
     meta: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> None:
     conn.execute(
         """INSERT INTO snapshots
@@ -31,7 +32,8 @@ def insert_snapshot(
             json.dumps(meta or {}),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_snapshot(conn: sqlite3.Connection, snapshot_id: str) -> dict[str, Any] | None:
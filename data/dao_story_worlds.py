@@ -21,6 +21,7 @@ def insert_world(
     current_timeline_position: str = "start",
     created_at: str,
     updated_at: str,
+    commit: bool = True,
 ) -> None:
     conn.execute(
         """INSERT INTO story_worlds
@@ -38,7 +39,8 @@ def insert_world(
             created_at, updated_at,
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_world(conn: sqlite3.Connection, world_id: str) -> dict[str, Any] | None:
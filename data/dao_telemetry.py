@@ -4,8 +4,13 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterable
 from typing import Any
 
+_INSERT_LEARNER_EVENT = """INSERT INTO learner_events
+           (event_id, cert_id, learner_id, event_type, objective_id, question_id, score, t, meta_json)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
 
 def insert_learner_event(
     conn: sqlite3.Connection,
@@ -21,15 +26,32 @@ def insert_learner_event(
     meta: dict[str, Any] | None = None,
 ) -> None:
     conn.execute(
-        """INSERT INTO learner_events
-           (event_id, cert_id, learner_id, event_type, objective_id, question_id, score, t, meta_json)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _INSERT_LEARNER_EVENT,
         (event_id, cert_id, learner_id, event_type, objective_id, question_id,
          score, t, json.dumps(meta or {})),
     )
     conn.commit()
 
 
+def insert_learner_events_batch(
+    conn: sqlite3.Connection,
+    events: Iterable[dict[str, Any]],
+) -> None:
+    """Insert many learner events in one transaction.
+
+    Each event dict takes the same keys as insert_learner_event's keyword
+    arguments. If any row fails, none of the batch is committed.
+    """
+    rows = [
+        (e["event_id"], e["cert_id"], e["learner_id"], e["event_type"],
+         e.get("objective_id"), e.get("question_id"), e.get("score"), e["t"],
+         json.dumps(e.get("meta") or {}))
+        for e in events
+    ]
+    with conn:
+        conn.executemany(_INSERT_LEARNER_EVENT, rows)
+
+
 def get_learner_events(
     conn: sqlite3.Connection,
     cert_id: str,
@@ -58,25 +80,30 @@ def get_learner_summary(
     learner_id: str,
 ) -> dict[str, Any]:
     """Aggregate learner performance for a certification."""
-    events = get_learner_events(conn, cert_id, learner_id)
-
-    quiz_attempts = [e for e in events if e["event_type"] == "quiz_attempt"]
-    module_views = [e for e in events if e["event_type"] == "module_view"]
-    completions = [e for e in events if e["event_type"] == "lesson_complete"]
-
-    scores = [e["score"] for e in quiz_attempts if e.get("score") is not None]
+    row = conn.execute(
+        """SELECT COUNT(*),
+                  TOTAL(event_type = 'quiz_attempt'),
+                  TOTAL(event_type = 'module_view'),
+                  TOTAL(event_type = 'lesson_complete'),
+                  AVG(CASE WHEN event_type = 'quiz_attempt' THEN score END),
+                  json_group_array(DISTINCT
+                      CASE WHEN event_type = 'quiz_attempt' THEN objective_id END)
+           FROM learner_events
+           WHERE cert_id = ? AND learner_id = ?""",
+        (cert_id, learner_id),
+    ).fetchone()
+    total, quizzes, views, completions, avg_score, objectives = row
 
     return {
         "cert_id": cert_id,
         "learner_id": learner_id,
-        "total_events": len(events),
-        "quiz_attempts": len(quiz_attempts),
-        "module_views": len(module_views),
-        "lessons_completed": len(completions),
-        "avg_score": round(sum(scores) / len(scores), 2) if scores else None,
-        "objectives_attempted": list({
-            e["objective_id"] for e in quiz_attempts if e.get("objective_id")
-        }),
+        "total_events": total,
+        "quiz_attempts": int(quizzes),
+        "module_views": int(views),
+        "lessons_completed": int(completions),
+        "avg_score": round(avg_score, 2) if avg_score is not None else None,
+        # NULL (non-quiz rows) and empty ids are dropped, as before.
+        "objectives_attempted": [o for o in json.loads(objectives) if o],
     }
 
 
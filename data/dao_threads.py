@@ -20,6 +20,7 @@ def insert_thread(
     related_character_ids: list[str] | None = None,
     escalation_points: list[dict[str, Any]] | None = None,
     meta: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> None:
     conn.execute(
         """INSERT INTO narrative_threads
@@ -35,7 +36,8 @@ def insert_thread(
             json.dumps(meta or {}),
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_threads_for_world(
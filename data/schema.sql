@@ -321,8 +321,11 @@ CREATE INDEX IF NOT EXISTS idx_cert_modules_obj ON cert_modules(objective_id);
 CREATE INDEX IF NOT EXISTS idx_cert_questions_obj ON cert_questions(objective_id);
 CREATE INDEX IF NOT EXISTS idx_lab_runs_suite ON lab_runs(suite_id);
 CREATE INDEX IF NOT EXISTS idx_lab_results_run ON lab_results(lab_run_id);
-CREATE INDEX IF NOT EXISTS idx_learner_events_cert ON learner_events(cert_id);
-CREATE INDEX IF NOT EXISTS idx_learner_events_learner ON learner_events(cert_id, learner_id);
+-- The (cert_id, learner_id, event_type) index also serves cert_id and
+-- (cert_id, learner_id) lookups, so the older prefix indexes are dropped.
+DROP INDEX IF EXISTS idx_learner_events_cert;
+DROP INDEX IF EXISTS idx_learner_events_learner;
+CREATE INDEX IF NOT EXISTS idx_learner_events_learner_type ON learner_events(cert_id, learner_id, event_type);
 CREATE INDEX IF NOT EXISTS idx_characters_world ON characters(world_id);
 CREATE INDEX IF NOT EXISTS idx_threads_world ON narrative_threads(world_id);
 CREATE INDEX IF NOT EXISTS idx_threads_status ON narrative_threads(world_id, status);
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoreComponent:
     """A single scoring dimension within a rubric."""
     name: str
@@ -15,7 +18,7 @@ class ScoreComponent:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rubric:
     """A scoring rubric composed of weighted score components."""
     rubric_id: str
@@ -124,12 +127,16 @@ SAFETY_RUBRIC = Rubric(
     passing_threshold=0.8,
 )
 
-BUILTIN_RUBRICS: dict[str, Rubric] = {
+_BUILTIN_RUBRICS: dict[str, Rubric] = {
     r.rubric_id: r for r in [
         ACCURACY_RUBRIC, REASONING_RUBRIC, CODING_RUBRIC,
         SUMMARIZATION_RUBRIC, INSTRUCTION_FOLLOWING_RUBRIC, SAFETY_RUBRIC,
     ]
 }
+_REGISTRY_LOCK = threading.Lock()
+
+# Read-only view; use register_rubric / unregister_rubric to change it.
+BUILTIN_RUBRICS = MappingProxyType(_BUILTIN_RUBRICS)
 
 # Category → default rubric mapping
 CATEGORY_RUBRICS: dict[str, str] = {
@@ -148,6 +155,7 @@ def get_rubric(rubric_id: str) -> Rubric:
     return BUILTIN_RUBRICS[rubric_id]
 
 
+@lru_cache(maxsize=32)
 def get_rubric_for_category(category: str) -> Rubric:
     """Get the default rubric for a task category."""
     rubric_id = CATEGORY_RUBRICS.get(category, "accuracy")
@@ -156,4 +164,14 @@ def get_rubric_for_category(category: str) -> Rubric:
 
 def register_rubric(rubric: Rubric) -> None:
     """Register a custom rubric."""
-    BUILTIN_RUBRICS[rubric.rubric_id] = rubric
+    with _REGISTRY_LOCK:
+        _BUILTIN_RUBRICS[rubric.rubric_id] = rubric
+        get_rubric_for_category.cache_clear()
+
+
+def unregister_rubric(rubric_id: str) -> None:
+    """Remove a previously registered rubric."""
+    with _REGISTRY_LOCK:
+        if _BUILTIN_RUBRICS.pop(rubric_id, None) is None:
+            raise KeyError(f"Unknown rubric: {rubric_id}")
+        get_rubric_for_category.cache_clear()
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import math
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable
 
 from eval.rubrics import Rubric, get_rubric
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoreResult:
     """Result of scoring a single task response."""
     task_id: str
@@ -109,7 +111,7 @@ def aggregate_scores(results: list[ScoreResult]) -> dict[str, Any]:
 # Baseline comparison with statistical significance
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BaselineComparison:
     """Result of comparing current scores against a baseline."""
     current_avg: float
@@ -121,19 +123,47 @@ class BaselineComparison:
     direction: str  # "improved", "regressed", "unchanged"
 
 
+@dataclass(slots=True, frozen=True)
+class ScoreResultBatch:
+    """Column-oriented view of many ScoreResults.
+
+    Holds weighted scores and pass flags in contiguous typed arrays so the
+    baseline statistics scan flat buffers instead of result objects.
+    """
+    scores: array  # array("d")
+    passed: array  # array("b")
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @classmethod
+    def from_iterable(cls, results: Iterable[ScoreResult]) -> ScoreResultBatch:
+        scores = array("d")
+        passed = array("b")
+        for r in results:
+            scores.append(r.weighted_score)
+            passed.append(r.passed)
+        return cls(scores=scores, passed=passed)
+
+
+def _as_batch(results: list[ScoreResult] | ScoreResultBatch) -> ScoreResultBatch:
+    if isinstance(results, ScoreResultBatch):
+        return results
+    return ScoreResultBatch.from_iterable(results)
+
+
 def compare_to_baseline(
-    current: list[ScoreResult],
-    baseline: list[ScoreResult],
+    current: list[ScoreResult] | ScoreResultBatch,
+    baseline: list[ScoreResult] | ScoreResultBatch,
     significance_level: float = 0.05,
 ) -> BaselineComparison:
     """Compare current scores to baseline with statistical significance.
 
-    Uses Welch's t-test approximation for unequal sample sizes.
+    Uses Welch's t-test approximation for unequal sample sizes. Accepts
+    either lists of ScoreResult or prebuilt ScoreResultBatch columns.
     """
-    import math
-
-    current_scores = [r.weighted_score for r in current]
-    baseline_scores = [r.weighted_score for r in baseline]
+    current_scores = _as_batch(current).scores
+    baseline_scores = _as_batch(baseline).scores
 
     n1, n2 = len(current_scores), len(baseline_scores)
     if n1 == 0 or n2 == 0:
@@ -143,13 +173,14 @@ def compare_to_baseline(
             direction="unchanged",
         )
 
-    mean1 = sum(current_scores) / n1
-    mean2 = sum(baseline_scores) / n2
+    # math.fsum runs the reduction in C with exact float summation
+    mean1 = math.fsum(current_scores) / n1
+    mean2 = math.fsum(baseline_scores) / n2
     delta = mean1 - mean2
 
     # Compute variance
-    var1 = sum((x - mean1) ** 2 for x in current_scores) / max(n1 - 1, 1)
-    var2 = sum((x - mean2) ** 2 for x in baseline_scores) / max(n2 - 1, 1)
+    var1 = math.fsum([(x - mean1) ** 2 for x in current_scores]) / max(n1 - 1, 1)
+    var2 = math.fsum([(x - mean2) ** 2 for x in baseline_scores]) / max(n2 - 1, 1)
 
     # Standard error of the difference
     se = math.sqrt(var1 / n1 + var2 / n2) if (var1 + var2 > 0) else 0.0
@@ -187,6 +218,5 @@ def _approx_two_tail_p(t: float) -> float:
 
     Uses the complementary error function approximation (no scipy needed).
     """
-    import math
     # Approximate using normal CDF: P(|Z| > t) ≈ erfc(t / sqrt(2))
     return math.erfc(t / math.sqrt(2))
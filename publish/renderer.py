@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import csv
 import hashlib
 import io
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -26,13 +28,19 @@ def _md_h3(text: str) -> str:
     return f"### {text}\n\n"
 
 
-def _md_table(headers: list[str], rows: list[list[str]]) -> str:
+@lru_cache(maxsize=None)
+def _md_table_head(headers: tuple[str, ...]) -> str:
+    """Header and separator lines for a table; built once per header set."""
+    return (
+        "| " + " | ".join(headers) + " |\n"
+        "| " + " | ".join("---" for _ in headers) + " |\n"
+    )
+
+
+def _md_table(headers: tuple[str, ...], rows: list[list[str]]) -> str:
     """Build a Markdown table from headers and rows."""
-    lines = ["| " + " | ".join(headers) + " |"]
-    lines.append("| " + " | ".join("---" for _ in headers) + " |")
-    for row in rows:
-        lines.append("| " + " | ".join(str(c) for c in row) + " |")
-    return "\n".join(lines) + "\n\n"
+    body = "".join("| " + " | ".join(str(c) for c in row) + " |\n" for row in rows)
+    return _md_table_head(headers) + body + "\n"
 
 
 def _md_bullet(items: list[str]) -> str:
@@ -64,7 +72,7 @@ def render_cert_markdown(state: dict[str, Any]) -> str:
                 obj.get("text", ""),
                 str(obj.get("weight", "")),
             ])
-        parts.append(_md_table(["Code", "Objective", "Weight"], rows))
+        parts.append(_md_table(("Code", "Objective", "Weight"), rows))
 
     # Lesson modules
     modules = state.get("modules", [])
@@ -177,7 +185,7 @@ def render_dossier_markdown(state: dict[str, Any]) -> str:
                 pt.get("t", ""),
                 str(pt.get("confidence", "")),
             ])
-        parts.append(_md_table(["Metric", "Value", "Unit", "Period", "Confidence"], rows))
+        parts.append(_md_table(("Metric", "Value", "Unit", "Period", "Confidence"), rows))
 
     # Contradictions
     contradictions = state.get("contradictions", [])
@@ -200,7 +208,7 @@ def render_dossier_markdown(state: dict[str, Any]) -> str:
                 cl.get("status", ""),
                 str(cl.get("confidence", "")),
             ])
-        parts.append(_md_table(["ID", "Statement", "Status", "Confidence"], rows))
+        parts.append(_md_table(("ID", "Statement", "Status", "Confidence"), rows))
 
     return "".join(parts)
 
@@ -231,7 +239,7 @@ def render_lab_markdown(state: dict[str, Any]) -> str:
     if models:
         parts.append(_md_h2("Models"))
         rows = [[m.get("model_id", "")] for m in models]
-        parts.append(_md_table(["Model ID"], rows))
+        parts.append(_md_table(("Model ID",), rows))
 
     # Synthesis / benchmark results
     synthesis = state.get("synthesis", {})
@@ -246,7 +254,7 @@ def render_lab_markdown(state: dict[str, Any]) -> str:
         if scores:
             parts.append(_md_h3("Scores"))
             rows = [[model, str(score)] for model, score in scores.items()]
-            parts.append(_md_table(["Model", "Score"], rows))
+            parts.append(_md_table(("Model", "Score"), rows))
 
         # Routing recommendations
         routing = synthesis.get("routing_config", {})
@@ -255,7 +263,7 @@ def render_lab_markdown(state: dict[str, Any]) -> str:
             rec = routing.get("recommended", {})
             if rec:
                 rows = [[task, model] for task, model in rec.items()]
-                parts.append(_md_table(["Task Category", "Recommended Model"], rows))
+                parts.append(_md_table(("Task Category", "Recommended Model"), rows))
             if routing.get("local_threshold"):
                 parts.append(f"**Local threshold:** {routing['local_threshold']}\n\n")
             if routing.get("frontier_threshold"):
@@ -276,7 +284,7 @@ def render_lab_markdown(state: dict[str, Any]) -> str:
                 m.get("unit", ""),
                 pt.get("t", ""),
             ])
-        parts.append(_md_table(["Metric", "Value", "Unit", "Period"], rows))
+        parts.append(_md_table(("Metric", "Value", "Unit", "Period"), rows))
 
     # Delta memo
     delta = state.get("delta_json", {})
@@ -383,7 +391,7 @@ def render_story_markdown(state: dict[str, Any]) -> str:
                 cl.get("claim_type", ""),
                 cl.get("statement", ""),
             ])
-        parts.append(_md_table(["ID", "Type", "Statement"], rows))
+        parts.append(_md_table(("ID", "Type", "Statement"), rows))
 
     # Delta
     delta = state.get("delta_json", {})
@@ -498,112 +506,64 @@ def render_markdown(scope_type: str, state: dict[str, Any]) -> str:
         raise ValueError(f"Unknown scope_type for rendering: {scope_type}")
 
 
-def _write_artifact(path: Path, content: str) -> str:
-    """Write content to file and return its sha256 hash. Uses binary mode for consistent hashing."""
-    data = content.encode("utf-8")
+def _write_artifact(path: Path, data: bytes) -> str:
+    """Write bytes to file and return their sha256 hash."""
     path.write_bytes(data)
     return hashlib.sha256(data).hexdigest()
 
 
 def render_exports(scope_type: str, state: dict[str, Any], publish_dir: Path) -> list[dict]:
-    """Render all export formats for a scope_type. Returns artifact metadata list."""
-    artifacts: list[dict] = []
+    """Render all export formats for a scope_type. Returns artifact metadata list.
+
+    All contents are rendered in memory first, then written concurrently;
+    the writes are I/O-bound so they overlap instead of running serially.
+    """
+    # (name, content, format) in artifact order
+    pending: list[tuple[str, str, str]] = []
 
     # Markdown for all scope types
-    md = render_markdown(scope_type, state)
-    md_path = publish_dir / "report.md"
-    md_hash = _write_artifact(md_path, md)
-    artifacts.append({
-        "name": "report.md",
-        "path": str(md_path),
-        "hash": md_hash,
-        "format": "markdown",
-    })
+    pending.append(("report.md", render_markdown(scope_type, state), "markdown"))
 
     # CSV exports for certification only
     if scope_type == "cert":
         modules = state.get("modules", [])
         if modules:
-            csv_content = export_cert_modules_csv(modules)
-            csv_path = publish_dir / "modules.csv"
-            csv_hash = _write_artifact(csv_path, csv_content)
-            artifacts.append({
-                "name": "modules.csv",
-                "path": str(csv_path),
-                "hash": csv_hash,
-                "format": "csv",
-            })
+            pending.append(("modules.csv", export_cert_modules_csv(modules), "csv"))
 
         questions = state.get("questions", [])
         if questions:
-            csv_content = export_cert_questions_csv(questions)
-            csv_path = publish_dir / "questions.csv"
-            csv_hash = _write_artifact(csv_path, csv_content)
-            artifacts.append({
-                "name": "questions.csv",
-                "path": str(csv_path),
-                "hash": csv_hash,
-                "format": "csv",
-            })
+            pending.append(("questions.csv", export_cert_questions_csv(questions), "csv"))
 
     # Story-specific exports
     if scope_type == "story":
         # episode.md — episode markdown (same as report.md but named per spec)
-        ep_md = render_story_markdown(state)
-        ep_md_path = publish_dir / "episode.md"
-        ep_md_hash = _write_artifact(ep_md_path, ep_md)
-        artifacts.append({
-            "name": "episode.md",
-            "path": str(ep_md_path),
-            "hash": ep_md_hash,
-            "format": "markdown",
-        })
+        pending.append(("episode.md", render_story_markdown(state), "markdown"))
 
         # episode.json — structured episode data
         ep_json = render_episode_json(state)
-        ep_json_content = json.dumps(ep_json, indent=2, default=str)
-        ep_json_path = publish_dir / "episode.json"
-        ep_json_hash = _write_artifact(ep_json_path, ep_json_content)
-        artifacts.append({
-            "name": "episode.json",
-            "path": str(ep_json_path),
-            "hash": ep_json_hash,
-            "format": "json",
-        })
+        pending.append(("episode.json", json.dumps(ep_json, indent=2, default=str), "json"))
 
         # narration_script.txt — plain text narration
         narration = state.get("narration_script", "")
         if narration:
-            narr_path = publish_dir / "narration_script.txt"
-            narr_hash = _write_artifact(narr_path, narration)
-            artifacts.append({
-                "name": "narration_script.txt",
-                "path": str(narr_path),
-                "hash": narr_hash,
-                "format": "text",
-            })
+            pending.append(("narration_script.txt", narration, "text"))
 
         # recap.md — "Previously on..." standalone markdown
-        recap_md = render_recap_markdown(state)
-        recap_path = publish_dir / "recap.md"
-        recap_hash = _write_artifact(recap_path, recap_md)
-        artifacts.append({
-            "name": "recap.md",
-            "path": str(recap_path),
-            "hash": recap_hash,
-            "format": "markdown",
-        })
+        pending.append(("recap.md", render_recap_markdown(state), "markdown"))
 
         # world_state.json — current world snapshot
         ws_json = render_world_state_json(state)
-        ws_content = json.dumps(ws_json, indent=2, default=str)
-        ws_path = publish_dir / "world_state.json"
-        ws_hash = _write_artifact(ws_path, ws_content)
-        artifacts.append({
-            "name": "world_state.json",
-            "path": str(ws_path),
-            "hash": ws_hash,
-            "format": "json",
-        })
+        pending.append(("world_state.json", json.dumps(ws_json, indent=2, default=str), "json"))
+
+    paths = [publish_dir / name for name, _, _ in pending]
+    payloads = [content.encode("utf-8") for _, content, _ in pending]
+    if len(pending) == 1:
+        hashes = [_write_artifact(paths[0], payloads[0])]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            hashes = list(pool.map(_write_artifact, paths, payloads))
 
-    return artifacts
+    return [
+        {"name": name, "path": str(path), "hash": digest, "format": fmt}
+        for (name, _, fmt), path, digest in zip(pending, paths, hashes)
+    ]
@@ -0,0 +1,64 @@
+"""Shared fixtures for unit and integration tests."""
+
+import pytest
+
+from agents import publisher_agent
+from data.db import get_connection, get_initialized_connection
+from data.dao_story_worlds import insert_world
+from data.dao_characters import insert_character
+from data.dao_threads import insert_thread
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _publish_root(tmp_path_factory):
+    """Publish into a per-module temp dir instead of the shared publish/out.
+
+    Module-scoped so module-scoped fixtures that publish see it too, and each
+    xdist worker gets its own root, so modules never race on artifacts.
+    """
+    root = tmp_path_factory.mktemp("publish")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(publisher_agent, "PUBLISH_ROOT", root)
+        yield root
+
+
+@pytest.fixture(scope="session")
+def story_db_template():
+    """Eldoria story world, built once per session (per xdist worker).
+
+    Never hand this connection to a test; use story_db for a private copy.
+    """
+    conn = get_initialized_connection(":memory:")
+    now = "2026-01-01T00:00:00Z"
+    with conn:
+        insert_world(
+            conn, world_id="eldoria-1", name="Eldoria", genre="fantasy", tone="whimsical",
+            setting={"geography": "Floating islands"},
+            thematic_constraints=["friendship", "courage"],
+            audience_profile={"age_range": "8-12", "vocabulary_level": "intermediate"},
+            created_at=now, updated_at=now, commit=False,
+        )
+        insert_character(
+            conn, character_id="char-aria", world_id="eldoria-1",
+            name="Aria", role="protagonist", traits=["brave", "curious"], commit=False,
+        )
+        insert_character(
+            conn, character_id="char-bram", world_id="eldoria-1",
+            name="Bram", role="supporting", traits=["loyal", "cautious"], commit=False,
+        )
+        insert_thread(
+            conn, thread_id="thread-crystal-storms", world_id="eldoria-1",
+            title="The Crystal Storms", introduced_in_episode=0,
+            thematic_tag="mystery", related_character_ids=["char-aria"], commit=False,
+        )
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def story_db(story_db_template):
+    """Private, writable copy of the Eldoria story world."""
+    conn = get_connection(":memory:")
+    story_db_template.backup(conn)
+    yield conn
+    conn.close()
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from agents import registry
+from agents import publisher_agent, registry
 from agents.ingestor_agent import IngestorAgent
 from agents.normalizer_agent import NormalizerAgent
 from agents.entity_resolver_agent import EntityResolverAgent
@@ -15,7 +15,7 @@ from agents.lesson_composer_agent import LessonComposerAgent
 from agents.question_generator_agent import QuestionGeneratorAgent
 from agents.qa_validator_agent import QAValidatorAgent
 from agents.delta_agent import DeltaAgent
-from agents.publisher_agent import PublisherAgent, PUBLISH_ROOT
+from agents.publisher_agent import PublisherAgent
 from core.orchestrator import execute_graph
 from core.state import create_initial_state
 from graphs.graph_types import load_graph
@@ -91,8 +91,9 @@ _MOCK_RESPONSES = {
 
 
 def _mock_model(system_prompt: str, user_message: str) -> str:
+    prompt_lower = system_prompt.lower()
     for key, response in _MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
+        if key in prompt_lower:
             return response
     return json.dumps({})
 
@@ -112,7 +113,7 @@ def setup_and_cleanup():
     yield
     registry.clear()
     # Clean up publish output
-    out_dir = PUBLISH_ROOT / "cert"
+    out_dir = publisher_agent.PUBLISH_ROOT / "cert"
     if out_dir.exists():
         shutil.rmtree(out_dir)
 
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from agents import registry
+from agents import publisher_agent, registry
 from agents.ingestor_agent import IngestorAgent
 from agents.normalizer_agent import NormalizerAgent
 from agents.entity_resolver_agent import EntityResolverAgent
@@ -15,7 +15,7 @@ from agents.metric_extractor_agent import MetricExtractorAgent
 from agents.contradiction_agent import ContradictionAgent
 from agents.delta_agent import DeltaAgent
 from agents.synthesizer_agent import SynthesizerAgent
-from agents.publisher_agent import PublisherAgent, PUBLISH_ROOT
+from agents.publisher_agent import PublisherAgent
 from core.orchestrator import execute_graph
 from core.state import create_initial_state
 from graphs.graph_types import load_graph
@@ -100,8 +100,9 @@ _MOCK_RESPONSES = {
 
 
 def _mock_model(system_prompt: str, user_message: str) -> str:
+    prompt_lower = system_prompt.lower()
     for key, response in _MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
+        if key in prompt_lower:
             return response
     return json.dumps({})
 
@@ -120,7 +121,7 @@ def setup_and_cleanup():
     registry.register(PublisherAgent())
     yield
     registry.clear()
-    out_dir = PUBLISH_ROOT / "topic"
+    out_dir = publisher_agent.PUBLISH_ROOT / "topic"
     if out_dir.exists():
         shutil.rmtree(out_dir)
 
@@ -36,10 +36,6 @@ from agents.story_memory_loader_agent import StoryMemoryLoaderAgent
 from agents.synthesizer_agent import SynthesizerAgent
 from core.orchestrator import execute_graph
 from core.state import create_initial_state
-from data.dao_characters import insert_character
-from data.dao_story_worlds import insert_world
-from data.dao_threads import insert_thread
-from data.db import get_initialized_connection
 from graphs.graph_types import Graph, load_graph
 
 GRAPHS_DIR = Path(__file__).parent.parent.parent / "graphs"
@@ -126,8 +122,9 @@ _STORY_MOCK_RESPONSES = {
 
 
 def _story_mock_model(system_prompt: str, user_message: str) -> str:
+    prompt_lower = system_prompt.lower()
     for key, response in _STORY_MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
+        if key in prompt_lower:
             return response
     return json.dumps({})
 
@@ -186,8 +183,9 @@ _CERT_MOCK_RESPONSES = {
 
 
 def _cert_mock_model(system_prompt: str, user_message: str) -> str:
+    prompt_lower = system_prompt.lower()
     for key, response in _CERT_MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
+        if key in prompt_lower:
             return response
     return json.dumps({})
 
@@ -248,8 +246,9 @@ _DOSSIER_MOCK_RESPONSES = {
 
 
 def _dossier_mock_model(system_prompt: str, user_message: str) -> str:
+    prompt_lower = system_prompt.lower()
     for key, response in _DOSSIER_MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
+        if key in prompt_lower:
             return response
     return json.dumps({})
 
@@ -290,8 +289,9 @@ _LAB_MOCK_RESPONSES = {
 
 
 def _lab_mock_model(system_prompt: str, user_message: str) -> str:
+    prompt_lower = system_prompt.lower()
     for key, response in _LAB_MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
+        if key in prompt_lower:
             return response
     return json.dumps({})
 
@@ -300,24 +300,6 @@ def _lab_mock_model(system_prompt: str, user_message: str) -> str:
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def story_db():
-    """In-memory DB with world, characters, and a thread for story tests."""
-    conn = get_initialized_connection(":memory:")
-    now = "2026-01-01T00:00:00Z"
-    insert_world(
-        conn, world_id="eldoria-1", name="Eldoria", genre="fantasy", tone="whimsical",
-        setting={"geography": "Floating islands"}, thematic_constraints=["friendship"],
-        audience_profile={"age_range": "8-12", "vocabulary_level": "intermediate"},
-        created_at=now, updated_at=now,
-    )
-    insert_character(conn, character_id="char-aria", world_id="eldoria-1", name="Aria", role="protagonist", traits=["brave", "curious"])
-    insert_character(conn, character_id="char-bram", world_id="eldoria-1", name="Bram", role="supporting", traits=["loyal", "cautious"])
-    insert_thread(conn, thread_id="thread-crystal-storms", world_id="eldoria-1", title="The Crystal Storms", introduced_in_episode=0, thematic_tag="mystery", related_character_ids=["char-aria"])
-    yield conn
-    conn.close()
-
-
 @pytest.fixture
 def register_story_agents():
     registry.clear()
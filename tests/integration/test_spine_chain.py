@@ -74,8 +74,9 @@ _MOCK_RESPONSES = {
 
 def _mock_model(system_prompt: str, user_message: str) -> str:
     """Route to correct mock response based on which agent is calling."""
+    prompt_lower = system_prompt.lower()
     for agent_key, response in _MOCK_RESPONSES.items():
-        if agent_key in system_prompt.lower():
+        if agent_key in prompt_lower:
             return response
     # Fallback: return empty
     return json.dumps({})
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from agents import registry
+from agents import publisher_agent, registry
 from agents.story_memory_loader_agent import StoryMemoryLoaderAgent
 from agents.premise_architect_agent import PremiseArchitectAgent
 from agents.plot_architect_agent import PlotArchitectAgent
@@ -17,13 +17,12 @@ from agents.narration_formatter_agent import NarrationFormatterAgent
 from agents.contradiction_agent import ContradictionAgent
 from agents.qa_validator_agent import QAValidatorAgent
 from agents.delta_agent import DeltaAgent
-from agents.publisher_agent import PublisherAgent, PUBLISH_ROOT
+from agents.publisher_agent import PublisherAgent
 from core.orchestrator import execute_graph
 from core.state import create_initial_state
-from data.db import get_initialized_connection
-from data.dao_story_worlds import insert_world, get_world
-from data.dao_characters import insert_character, get_character
-from data.dao_threads import insert_thread, get_thread
+from data.dao_story_worlds import get_world
+from data.dao_characters import get_character
+from data.dao_threads import get_thread
 from data.dao_episodes import insert_episode, get_episodes_for_world
 from graphs.graph_types import load_graph
 
@@ -112,40 +111,6 @@ def _mock_model(system_prompt: str, user_message: str) -> str:
     return json.dumps({})
 
 
-@pytest.fixture
-def story_db():
-    """Create an in-memory DB with world, characters, and a thread."""
-    conn = get_initialized_connection(":memory:")
-    now = "2026-01-01T00:00:00Z"
-    insert_world(
-        conn,
-        world_id="eldoria-1",
-        name="Eldoria",
-        genre="fantasy",
-        tone="whimsical",
-        setting={"geography": "Floating islands"},
-        thematic_constraints=["friendship", "courage"],
-        audience_profile={"age_range": "8-12", "vocabulary_level": "intermediate"},
-        created_at=now,
-        updated_at=now,
-    )
-    insert_character(
-        conn, character_id="char-aria", world_id="eldoria-1",
-        name="Aria", role="protagonist", traits=["brave", "curious"],
-    )
-    insert_character(
-        conn, character_id="char-bram", world_id="eldoria-1",
-        name="Bram", role="supporting", traits=["loyal", "cautious"],
-    )
-    insert_thread(
-        conn, thread_id="thread-crystal-storms", world_id="eldoria-1",
-        title="The Crystal Storms", introduced_in_episode=0,
-        thematic_tag="mystery", related_character_ids=["char-aria"],
-    )
-    yield conn
-    conn.close()
-
-
 @pytest.fixture(autouse=True)
 def setup_and_cleanup():
     registry.clear()
@@ -162,7 +127,7 @@ def setup_and_cleanup():
     registry.register(PublisherAgent())
     yield
     registry.clear()
-    out_dir = PUBLISH_ROOT / "story"
+    out_dir = publisher_agent.PUBLISH_ROOT / "story"
     if out_dir.exists():
         shutil.rmtree(out_dir)
 
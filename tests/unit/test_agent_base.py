@@ -5,7 +5,7 @@ import json
 import pytest
 from pydantic import BaseModel
 
-from agents.base_agent import AgentPolicy, BaseAgent, extract_json
+from agents.base_agent import AgentPolicy, BaseAgent, extract_json, loads_json
 from agents import registry
 
 
@@ -63,6 +63,12 @@ def test_build_prompt():
     assert user == "Echo: hello"
 
 
+def test_build_prompt_keeps_unknown_placeholders():
+    agent = EchoAgent()
+    _, user = agent.build_prompt({})
+    assert user == "Echo: {message}"
+
+
 def test_parse_and_validate():
     agent = EchoAgent()
     result = agent.parse('{"echoed": "hello"}')
@@ -166,6 +172,23 @@ class TestExtractJson:
         assert delta["echoed"] == "Echo: test"
 
 
+class TestLoadsJson:
+    def test_decodes_str_and_bytes(self):
+        assert loads_json('{"a": [1, "x"]}') == {"a": [1, "x"]}
+        assert loads_json(b'{"a": null}') == {"a": None}
+
+    def test_invalid_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads_json("{not json")
+
+    @pytest.mark.parametrize("text", ['{"a": NaN}', '"\\ud800"', b'{"a": Infinity}'])
+    def test_accepts_what_json_accepts(self, text):
+        # orjson rejects these; the json fallback must still decode them.
+        expected = json.loads(text)
+        result = loads_json(text)
+        assert repr(result) == repr(expected)  # NaN != NaN, so compare reprs
+
+
 # --- validation-feedback retry tests ---
 
 class TestValidationRepair:
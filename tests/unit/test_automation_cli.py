@@ -28,7 +28,7 @@ def _bootstrap(tmp_path, extra_yaml=""):
 
     for d in ["auto", "auto/tasks", "auto/processing", "auto/outputs",
               "auto/archive", "auto/logs", "auto/schemas"]:
-        (tmp_path / d).mkdir(parents=True, exist_ok=True)
+        (tmp_path / d).mkdir()
 
     # Initialise empty queue
     queue_path = tmp_path / "auto" / "queue.json"
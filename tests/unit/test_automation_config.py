@@ -89,3 +89,9 @@ class TestLoadConfig:
         assert cfg.paths.tasks == "automation/tasks"
         assert cfg.validation.require_meta is True
         assert cfg.watcher.interval_seconds == 5
+
+    def test_paths_from_base(self, tmp_path):
+        paths = PathsConfig.from_base(tmp_path / "auto")
+        assert paths.base == str(tmp_path / "auto")
+        assert paths.outputs == str(tmp_path / "auto" / "outputs")
+        assert paths.schemas == str(tmp_path / "auto" / "schemas")
@@ -1,23 +1,17 @@
 """Tests for the automation structured logging module."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from automation import logging as automation_logging
 from automation.config import AutomationConfig, PathsConfig
-from automation.logging import ACTIONS, log_event, log_path, read_log
+from automation.logging import ACTIONS, log_event, log_events, log_path, make_entry, read_log
 
 
 def _cfg(tmp_path) -> AutomationConfig:
-    paths = PathsConfig(
-        base=str(tmp_path / "auto"),
-        tasks=str(tmp_path / "auto" / "tasks"),
-        processing=str(tmp_path / "auto" / "processing"),
-        outputs=str(tmp_path / "auto" / "outputs"),
-        archive=str(tmp_path / "auto" / "archive"),
-        logs=str(tmp_path / "auto" / "logs"),
-        schemas=str(tmp_path / "auto" / "schemas"),
-    )
+    paths = PathsConfig.from_base(tmp_path / "auto")
     return AutomationConfig(paths=paths)
 
 
@@ -63,6 +57,37 @@ class TestLogEvent:
         assert entries[1]["action"] == "task_completed"
         assert entries[2]["action"] == "watcher_poll"
 
+    def test_batch_appends_in_order(self, tmp_path):
+        cfg = _cfg(tmp_path)
+        log_event(cfg, action="task_created", task_id="t-001")
+        log_events(cfg, [
+            make_entry(action="task_completed", task_id="t-001"),
+            make_entry(action="watcher_poll"),
+        ])
+        log_events(cfg, [])
+
+        assert [e["action"] for e in read_log(cfg)] == [
+            "task_created", "task_completed", "watcher_poll",
+        ]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_lone_surrogate_is_escaped(self, tmp_path, monkeypatch, use_orjson):
+        """Non-UTF-8 file names (via os.fsdecode) must not break logging."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(automation_logging, "orjson", None)
+        cfg = _cfg(tmp_path)
+        task_id = os.fsdecode(b"2026-01-01-001\xff")
+        log_events(cfg, [
+            make_entry(action="task_completed", task_id=task_id),
+            make_entry(action="watcher_poll"),
+        ])
+
+        entries = read_log(cfg)
+        assert [e["action"] for e in entries] == ["task_completed", "watcher_poll"]
+        assert entries[0]["task_id"] == task_id
+
 
 class TestReadLog:
     def test_empty_log(self, tmp_path):
@@ -1,9 +1,11 @@
 """Tests for automation queue state management."""
 
 import json
+import os
 
 import pytest
 
+from automation import queue as automation_queue
 from automation.queue import (
     QueueState,
     add_pending,
@@ -35,6 +37,19 @@ class TestQueueRoundtrip:
         assert loaded.failed == ["t5"]
         assert loaded.parents == {"t3": "t1"}
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_roundtrip_lone_surrogate(self, tmp_path, monkeypatch, use_orjson):
+        """Task IDs decoded from non-UTF-8 file names survive a save/load."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(automation_queue, "orjson", None)
+        task_id = os.fsdecode(b"2026-01-01-001\xff")
+        path = tmp_path / "queue.json"
+        save_queue(path, QueueState(processing=[task_id]))
+
+        assert load_queue(path).processing == [task_id]
+
 
 class TestAddPending:
     def test_add_pending(self):
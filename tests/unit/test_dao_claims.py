@@ -51,3 +51,10 @@ def test_update_claim_status(conn):
     c = get_claim(conn, "c1")
     assert c["status"] == "disputed"
     assert c["last_confirmed_at"] == "2026-02-01"
+
+
+def test_insert_claim_without_commit_joins_caller_transaction(conn):
+    insert_claim(conn, claim_id="c1", scope_type="cert", scope_id="x", statement="A", claim_type="f", first_seen_at="2026-01-01", commit=False)
+    assert conn.in_transaction
+    conn.rollback()
+    assert get_claim(conn, "c1") is None
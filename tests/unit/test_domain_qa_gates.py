@@ -48,7 +48,7 @@ class TestCertQAGate:
         ]
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "cert_objective_has_module" in rules
 
     def test_cert_fail_insufficient_questions(self):
@@ -60,7 +60,7 @@ class TestCertQAGate:
         ]  # Only 1, needs 2 for weight=1.0
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "cert_objective_min_questions" in rules
 
     def test_cert_weight_proportional_questions(self):
@@ -126,7 +126,7 @@ class TestDossierQAGate:
         state["segment_ids"] = ["s1"]
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "dossier_disputed_claim_status" in rules
 
     def test_dossier_fail_contradiction_no_reason(self):
@@ -140,7 +140,7 @@ class TestDossierQAGate:
         ]
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "dossier_contradiction_has_reason" in rules
 
 
@@ -176,7 +176,7 @@ class TestLabQAGate:
         state["hw_spec"] = {}
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "lab_has_hw_spec" in rules
 
     def test_lab_fail_no_models(self):
@@ -184,7 +184,7 @@ class TestLabQAGate:
         state["models"] = []
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "lab_has_models" in rules
 
     def test_lab_fail_model_missing_score(self):
@@ -197,7 +197,7 @@ class TestLabQAGate:
         }
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "lab_model_has_score" in rules
 
     def test_lab_fail_metrics_referenced_but_missing(self):
@@ -210,5 +210,5 @@ class TestLabQAGate:
         state["metrics"] = []
         result = self.qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "lab_metrics_present" in rules
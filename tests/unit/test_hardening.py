@@ -95,19 +95,11 @@ FAILED_RESULT = textwrap.dedent("""\
 
 
 def _cfg(tmp_path) -> AutomationConfig:
-    paths = PathsConfig(
-        base=str(tmp_path / "auto"),
-        tasks=str(tmp_path / "auto" / "tasks"),
-        processing=str(tmp_path / "auto" / "processing"),
-        outputs=str(tmp_path / "auto" / "outputs"),
-        archive=str(tmp_path / "auto" / "archive"),
-        logs=str(tmp_path / "auto" / "logs"),
-        schemas=str(tmp_path / "auto" / "schemas"),
-    )
+    paths = PathsConfig.from_base(tmp_path / "auto")
     cfg = AutomationConfig(paths=paths)
     for d in [paths.base, paths.tasks, paths.processing, paths.outputs,
               paths.archive, paths.logs, paths.schemas]:
-        Path(d).mkdir(parents=True, exist_ok=True)
+        Path(d).mkdir()
     save_queue(tmp_path / "auto" / "queue.json", QueueState())
     return cfg
 
@@ -143,8 +135,7 @@ class TestHeaderMismatch:
         (Path(cfg.paths.outputs) / "nonexistent-task.result.md").write_text(
             MISMATCHED_RESULT)
 
-        processed = watch_once(cfg)
-        assert processed == []
+        assert watch_once(cfg).processed == []
 
 
 class TestRebuildQueue:
@@ -1,5 +1,6 @@
 """Tests for the automation task processor and result writer."""
 
+import os
 import textwrap
 
 import pytest
@@ -18,22 +19,13 @@ from automation.validator import validate_result
 
 def _setup(tmp_path) -> AutomationConfig:
     """Create directory structure and return config pointing at tmp_path."""
-    paths = PathsConfig(
-        base=str(tmp_path / "auto"),
-        tasks=str(tmp_path / "auto" / "tasks"),
-        processing=str(tmp_path / "auto" / "processing"),
-        outputs=str(tmp_path / "auto" / "outputs"),
-        archive=str(tmp_path / "auto" / "archive"),
-        logs=str(tmp_path / "auto" / "logs"),
-        schemas=str(tmp_path / "auto" / "schemas"),
-    )
+    paths = PathsConfig.from_base(tmp_path / "auto")
     cfg = AutomationConfig(paths=paths)
 
+    # tmp_path is fresh and base comes first, so plain mkdir suffices.
     for d in [paths.base, paths.tasks, paths.processing, paths.outputs,
               paths.archive, paths.logs, paths.schemas]:
-        (tmp_path / d) if d.startswith(str(tmp_path)) else None
-        from pathlib import Path
-        Path(d).mkdir(parents=True, exist_ok=True)
+        os.mkdir(d)
 
     save_queue(tmp_path / "auto" / "queue.json", QueueState())
     return cfg
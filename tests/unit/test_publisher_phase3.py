@@ -7,8 +7,8 @@ from pathlib import Path
 
 import pytest
 
-from agents import registry
-from agents.publisher_agent import PublisherAgent, PUBLISH_ROOT
+from agents import publisher_agent, registry
+from agents.publisher_agent import PublisherAgent
 from agents.qa_validator_agent import QAValidatorAgent
 
 
@@ -20,7 +20,7 @@ def cleanup():
     yield
     registry.clear()
     for scope in ("cert", "topic", "lab"):
-        d = PUBLISH_ROOT / scope
+        d = publisher_agent.PUBLISH_ROOT / scope
         if d.exists():
             shutil.rmtree(d)
 
@@ -269,6 +269,14 @@ class TestVersioningIntegration:
         assert r1["manifest"]["version"] == "1.0.0"
         assert r2["manifest"]["version"] == "1.1.0"
 
+    def test_cert_semver_follows_patched_publish_root(self):
+        # conftest points PUBLISH_ROOT at a temp dir; numbering must read it
+        # there, not from the import-time publish/out default.
+        (publisher_agent.PUBLISH_ROOT / "cert" / "aws-101" / "3.4.0").mkdir(parents=True)
+        result = PublisherAgent().run(_cert_state())
+        assert result["manifest"]["version"] == "3.5.0"
+        assert result["publish_dir"].startswith(str(publisher_agent.PUBLISH_ROOT))
+
     def test_dossier_gets_date_version(self):
         agent = PublisherAgent()
         result = agent.run(_dossier_state())
@@ -347,7 +355,7 @@ class TestQAGateBlocking:
         }
         result = qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "publish_requires_snapshot" in rules
         assert "publish_requires_delta" in rules
 
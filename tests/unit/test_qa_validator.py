@@ -102,7 +102,7 @@ class TestQAFailCases:
         state = _base_state(_check_publish=True)
         result = qa.run(state)
         assert result["gate_status"] == "FAIL"
-        rules = [v["rule"] for v in result["violations"]]
+        rules = {v["rule"] for v in result["violations"]}
         assert "publish_requires_snapshot" in rules
         assert "publish_requires_delta" in rules
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import tempfile
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
@@ -15,9 +15,13 @@ from core.routing import (
     RouterConfig,
     TierConfig,
     load_router_config,
+    load_router_config_from_dict,
 )
 
 
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 SAMPLE_CONFIG = {
     "tier1": {
         "model": "deepseek-r1:1.5b",
@@ -67,19 +71,25 @@ SAMPLE_CONFIG = {
 }
 
 
-@pytest.fixture
-def config_path(tmp_path: Path) -> Path:
-    path = tmp_path / "router_config.yaml"
-    path.write_text(yaml.dump(SAMPLE_CONFIG))
+@pytest.fixture(scope="session")
+def config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("router_config") / "router_config.yaml"
+    path.write_text(yaml.dump(SAMPLE_CONFIG, Dumper=_YAML_DUMPER))
     return path
 
 
+@pytest.fixture(scope="session")
+def cfg() -> RouterConfig:
+    return load_router_config_from_dict(SAMPLE_CONFIG)
+
+
 class TestLoadRouterConfig:
-    def test_parses_yaml(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
-        assert isinstance(cfg, RouterConfig)
-        assert cfg.provider_selection_strategy == "prefer_local"
-        assert cfg.daily_frontier_cap == 100
+    def test_parses_yaml(self, config_path: Path, cfg: RouterConfig) -> None:
+        loaded = load_router_config(config_path)
+        assert isinstance(loaded, RouterConfig)
+        assert loaded.provider_selection_strategy == "prefer_local"
+        assert loaded.daily_frontier_cap == 100
+        assert loaded == cfg
 
     def test_loads_actual_config_file(self) -> None:
         """Verify the shipped config/router_config.yaml parses."""
@@ -89,16 +99,14 @@ class TestLoadRouterConfig:
 
 
 class TestTierConfig:
-    def test_tier1_values(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
+    def test_tier1_values(self, cfg: RouterConfig) -> None:
         assert cfg.tier1.model == "deepseek-r1:1.5b"
         assert cfg.tier1.context_length == 2048
         assert cfg.tier1.max_tokens == 128
         assert cfg.tier1.temperature == 0.0
         assert cfg.tier1.concurrency == 8
 
-    def test_tier2_values(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
+    def test_tier2_values(self, cfg: RouterConfig) -> None:
         assert cfg.tier2.model == "deepseek-r1:1.5b"
         assert cfg.tier2.context_length == 4096
         assert cfg.tier2.max_tokens == 1024
@@ -107,16 +115,14 @@ class TestTierConfig:
 
 
 class TestProviderConfig:
-    def test_provider_list(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
+    def test_provider_list(self, cfg: RouterConfig) -> None:
         assert len(cfg.tier3_providers) == 2
         names = [p.name for p in cfg.tier3_providers]
         assert "dgx_spark" in names
         assert "anthropic_claude" in names
 
-    def test_provider_fields(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
-        dgx = next(p for p in cfg.tier3_providers if p.name == "dgx_spark")
+    def test_provider_fields(self, cfg: RouterConfig) -> None:
+        dgx = cfg.get_provider("dgx_spark")
         assert dgx.provider_type == "dgx"
         assert dgx.model == "llama3:70b"
         assert dgx.host == "http://dgx-spark:11434"
@@ -124,8 +130,15 @@ class TestProviderConfig:
         assert dgx.quality_score == 0.85
         assert "local" in dgx.tags
 
-    def test_escalation_criteria(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
+    def test_get_provider_unknown(self, cfg: RouterConfig) -> None:
+        assert cfg.get_provider("nonexistent") is None
+
+    def test_config_is_frozen(self, cfg: RouterConfig) -> None:
+        with pytest.raises(FrozenInstanceError):
+            cfg.tier1.max_tokens = 1
+        assert not hasattr(cfg.tier1, "__dict__")
+
+    def test_escalation_criteria(self, cfg: RouterConfig) -> None:
         assert cfg.escalation.min_confidence == 0.75
         assert cfg.escalation.max_missing_citations == 2
         assert cfg.escalation.max_contradiction_ambiguity == 0.5
@@ -133,8 +146,7 @@ class TestProviderConfig:
 
 
 class TestRouterWithConfig:
-    def test_model_router_accepts_config(self, config_path: Path) -> None:
-        cfg = load_router_config(config_path)
+    def test_model_router_accepts_config(self, cfg: RouterConfig) -> None:
         router = ModelRouter(
             escalation_criteria=cfg.escalation,
             config=cfg,
@@ -6,6 +6,7 @@ from core.routing import (
     EscalationCriteria,
     ModelRouter,
     RoutingDecision,
+    get_router,
     set_router,
     select_model,
 )
@@ -20,18 +21,25 @@ class FakeAdapter:
         return self._response
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def router():
+    # Shared across the module: select_model and get_model_callable are pure
+    # functions of policy and state and never mutate the router.
     r = ModelRouter(escalation_criteria=EscalationCriteria(min_confidence=0.7))
     r.register_local(FakeAdapter("local"))
     r.register_frontier(FakeAdapter("frontier"))
     return r
 
 
+_POLICY_DEFAULTS = dict(allowed_local_models=["local"], allowed_frontier_models=["frontier"])
+# Shared by tests that take the defaults; routing only reads the policy.
+_DEFAULT_POLICY = AgentPolicy(**_POLICY_DEFAULTS)
+
+
 def _policy(**overrides):
-    defaults = dict(allowed_local_models=["local"], allowed_frontier_models=["frontier"])
-    defaults.update(overrides)
-    return AgentPolicy(**defaults)
+    if not overrides:
+        return _DEFAULT_POLICY
+    return AgentPolicy(**{**_POLICY_DEFAULTS, **overrides})
 
 
 class TestLocalFirst:
@@ -83,6 +91,11 @@ class TestEscalation:
         assert "low confidence" in decision.reason
         assert "missing citations" in decision.reason
 
+    def test_thresholds_follow_router_criteria(self):
+        lenient = ModelRouter(escalation_criteria=EscalationCriteria(min_confidence=0.2))
+        decision = lenient.select_model(_policy(), {"_last_confidence": 0.3})
+        assert not decision.escalated
+
 
 class TestModelCallable:
     def test_get_local_callable(self, router):
@@ -103,6 +116,10 @@ class TestModelCallable:
 
 class TestModuleLevelFunctions:
     def test_select_model_uses_default_router(self, router):
+        previous = get_router()
         set_router(router)
-        decision = select_model(_policy(), {})
+        try:
+            decision = select_model(_policy(), {})
+        finally:
+            set_router(previous)  # keep the module global clean for other tests
         assert decision.model_name == "local"
@@ -1,50 +1,63 @@
 """Tests for the cron scheduler engine."""
 
 import textwrap
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from core.scheduler import (
+    _CRON_SHORTCUTS,
     ScheduleConfig,
     ScheduleEntry,
     SchedulerState,
+    _compile_cron,
     _parse_cron_field,
     cron_matches,
     get_due_entries,
     load_schedule_config,
+    next_fire,
     run_scheduler,
 )
 
 
+def _m(*vals: int) -> int:
+    """Bitmask with the given values set, as returned by _parse_cron_field."""
+    mask = 0
+    for v in vals:
+        mask |= 1 << v
+    return mask
+
+
 class TestCronFieldParsing:
     def test_wildcard(self):
-        assert _parse_cron_field("*", 0, 59) == set(range(0, 60))
+        assert _parse_cron_field("*", 0, 59) == _m(*range(0, 60))
+
+    def test_wildcard_nonzero_min(self):
+        assert _parse_cron_field("*", 1, 12) == _m(*range(1, 13))
 
     def test_single_value(self):
-        assert _parse_cron_field("5", 0, 59) == {5}
+        assert _parse_cron_field("5", 0, 59) == _m(5)
 
     def test_range(self):
-        assert _parse_cron_field("1-5", 0, 59) == {1, 2, 3, 4, 5}
+        assert _parse_cron_field("1-5", 0, 59) == _m(1, 2, 3, 4, 5)
 
     def test_step(self):
-        assert _parse_cron_field("*/15", 0, 59) == {0, 15, 30, 45}
+        assert _parse_cron_field("*/15", 0, 59) == _m(0, 15, 30, 45)
 
     def test_range_with_step(self):
-        assert _parse_cron_field("1-10/3", 0, 59) == {1, 4, 7, 10}
+        assert _parse_cron_field("1-10/3", 0, 59) == _m(1, 4, 7, 10)
 
     def test_list(self):
-        assert _parse_cron_field("1,3,5", 0, 59) == {1, 3, 5}
+        assert _parse_cron_field("1,3,5", 0, 59) == _m(1, 3, 5)
 
     def test_complex(self):
         result = _parse_cron_field("1-5,10,*/20", 0, 59)
-        assert 1 in result
-        assert 5 in result
-        assert 10 in result
-        assert 0 in result
-        assert 20 in result
-        assert 40 in result
+        assert result == _m(1, 2, 3, 4, 5, 10, 0, 20, 40)
+
+    def test_compiled_expression_is_cached(self):
+        assert _compile_cron("30 2 * * *") is _compile_cron("30 2 * * *")
+        assert _compile_cron("daily")[0] == _m(0)
 
 
 class TestCronMatches:
@@ -77,6 +90,13 @@ class TestCronMatches:
         dt = datetime(2026, 2, 16, 15, 0, tzinfo=timezone.utc)
         assert cron_matches("hourly", dt)
 
+    def test_shortcut_fast_path_matches_expansion(self):
+        dt = datetime(2026, 1, 31, 22, 0, tzinfo=timezone.utc)
+        for _ in range(24 * 10):
+            for name, expr in _CRON_SHORTCUTS.items():
+                assert cron_matches(name, dt) == cron_matches(expr, dt), (name, dt)
+            dt += timedelta(minutes=30)
+
     def test_specific_cron(self):
         # "30 2 * * *" = every day at 02:30
         dt = datetime(2026, 2, 16, 2, 30, tzinfo=timezone.utc)
@@ -102,6 +122,34 @@ class TestCronMatches:
         assert cron_matches("0 0 * * 3", dt)
 
 
+class TestNextFire:
+    def test_within_matching_minute(self):
+        after = datetime(2026, 2, 16, 2, 30, 45, tzinfo=timezone.utc)
+        assert next_fire("30 2 * * *", after) == datetime(2026, 2, 16, 2, 30, tzinfo=timezone.utc)
+
+    def test_rolls_to_next_day(self):
+        after = datetime(2026, 2, 16, 2, 31, tzinfo=timezone.utc)
+        assert next_fire("30 2 * * *", after) == datetime(2026, 2, 17, 2, 30, tzinfo=timezone.utc)
+
+    def test_weekly_from_tuesday(self):
+        after = datetime(2026, 2, 17, 9, 0, tzinfo=timezone.utc)
+        # Next Monday midnight
+        assert next_fire("weekly", after) == datetime(2026, 2, 23, 0, 0, tzinfo=timezone.utc)
+
+    def test_step_minutes(self):
+        after = datetime(2026, 2, 16, 10, 16, tzinfo=timezone.utc)
+        assert next_fire("*/15 * * * *", after) == datetime(2026, 2, 16, 10, 30, tzinfo=timezone.utc)
+
+    def test_leap_day(self):
+        after = datetime(2026, 3, 1, 0, 0, tzinfo=timezone.utc)
+        assert next_fire("0 0 29 2 *", after) == datetime(2028, 2, 29, 0, 0, tzinfo=timezone.utc)
+
+    def test_never_fires(self):
+        after = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+        with pytest.raises(ValueError, match="never fires"):
+            next_fire("0 0 31 2 *", after)
+
+
 class TestGetDueEntries:
     def test_returns_enabled_matching(self):
         config = ScheduleConfig(entries=[
@@ -172,6 +220,28 @@ class TestRunScheduler:
         assert state.runs_dispatched >= 0
         assert isinstance(state, SchedulerState)
 
+    def test_every_minute_fires_once(self):
+        dispatched = []
+        config = ScheduleConfig(entries=[
+            ScheduleEntry(name="a", graph="cert", scope_id="c1", cron="* * * * *"),
+            ScheduleEntry(name="off", graph="cert", scope_id="c2", cron="* * * * *",
+                          enabled=False),
+        ])
+        state = run_scheduler(config, lambda e: dispatched.append(e.name), max_iterations=1)
+        assert dispatched == ["a"]
+        assert state.runs_dispatched == 1
+
+    def test_never_firing_entry_does_not_stop_others(self):
+        dispatched = []
+        config = ScheduleConfig(entries=[
+            ScheduleEntry(name="a", graph="cert", scope_id="c1", cron="0 0 30 2 *"),
+            ScheduleEntry(name="b", graph="cert", scope_id="c2", cron="* * * * *"),
+        ])
+        state = run_scheduler(config, lambda e: dispatched.append(e.name), max_iterations=1)
+        assert dispatched == ["b"]
+        assert len(state.errors) == 1
+        assert "'a'" in state.errors[0]
+
     def test_dispatch_error_captured(self):
         config = ScheduleConfig(entries=[
             ScheduleEntry(name="fail", graph="cert", scope_id="c1", cron="hourly"),
@@ -10,10 +10,12 @@ from eval.rubrics import (
     get_rubric,
     get_rubric_for_category,
     register_rubric,
+    unregister_rubric,
 )
 from eval.scoring import (
     BaselineComparison,
     ScoreResult,
+    ScoreResultBatch,
     compare_to_baseline,
     score_response,
 )
@@ -70,8 +72,31 @@ class TestCustomRubric:
         register_rubric(custom)
         retrieved = get_rubric("custom_test")
         assert retrieved.name == "Custom Test Rubric"
-        # Clean up
-        del BUILTIN_RUBRICS["custom_test"]
+        unregister_rubric("custom_test")
+        assert "custom_test" not in BUILTIN_RUBRICS
+
+    def test_builtin_rubrics_is_read_only(self):
+        with pytest.raises(TypeError):
+            BUILTIN_RUBRICS["x"] = get_rubric("accuracy")
+
+    def test_register_overrides_cached_category(self):
+        original = get_rubric_for_category("coding")
+        override = Rubric(rubric_id="coding", name="Override", components=[])
+        register_rubric(override)
+        try:
+            assert get_rubric_for_category("coding") is override
+        finally:
+            register_rubric(original)
+        assert get_rubric_for_category("coding") is original
+
+    def test_unregister_unknown_raises(self):
+        with pytest.raises(KeyError):
+            unregister_rubric("never_registered")
+
+
+# Shared by every synthetic result; compare_to_baseline never reads or
+# mutates component scores.
+_NO_COMPONENT_SCORES: dict[str, float] = {}
 
 
 class TestBaselineComparison:
@@ -79,7 +104,7 @@ class TestBaselineComparison:
         return [
             ScoreResult(
                 task_id=f"t{i}", model_id="model-a",
-                scores_json={}, weighted_score=s, passed=s >= 0.5,
+                scores_json=_NO_COMPONENT_SCORES, weighted_score=s, passed=s >= 0.5,
             )
             for i, s in enumerate(scores)
         ]
@@ -131,3 +156,11 @@ class TestBaselineComparison:
         comp = compare_to_baseline(current, baseline)
         # 0.1 / 0.5 = 0.2 = 20% improvement
         assert abs(comp.relative_change - 0.2) < 0.01
+
+    def test_batch_matches_list_input(self):
+        current = self._make_results([0.9, 0.85, 0.95, 0.88])
+        baseline = self._make_results([0.3, 0.35, 0.25])
+        batch = ScoreResultBatch.from_iterable(current)
+        assert len(batch) == 4
+        assert list(batch.passed) == [1, 1, 1, 1]
+        assert compare_to_baseline(batch, baseline) == compare_to_baseline(current, baseline)
@@ -13,20 +13,24 @@ from agents.metric_extractor_agent import MetricExtractorAgent
 from agents.contradiction_agent import ContradictionAgent
 
 
+# Serialized model responses are built once at import and shared by tests.
+
 # --- Ingestor ---
 
+_INGESTOR_RESPONSE = json.dumps({
+    "doc_ids": ["d1"],
+    "segment_ids": ["s1", "s2"],
+    "source_docs": [{"doc_id": "d1", "uri": "http://x"}],
+    "source_segments": [{"segment_id": "s1"}, {"segment_id": "s2"}],
+})
+
+
 class TestIngestor:
     def setup_method(self):
         self.agent = IngestorAgent()
 
     def test_parse_valid(self):
-        resp = json.dumps({
-            "doc_ids": ["d1"],
-            "segment_ids": ["s1", "s2"],
-            "source_docs": [{"doc_id": "d1", "uri": "http://x"}],
-            "source_segments": [{"segment_id": "s1"}, {"segment_id": "s2"}],
-        })
-        result = self.agent.parse(resp)
+        result = self.agent.parse(_INGESTOR_RESPONSE)
         assert result["doc_ids"] == ["d1"]
         assert len(result["segment_ids"]) == 2
 
@@ -43,21 +47,38 @@ class TestIngestor:
         assert len(segs) >= 2
         assert all(s["doc_id"] == "doc1" for s in segs)
 
+    def test_segment_text_repeat_gets_fresh_ids(self):
+        text = "Para one.\n\nPara two.\n\nPara three."
+        first = IngestorAgent.segment_text("doc1", text, max_chars=20)
+        second = IngestorAgent.segment_text("doc2", text, max_chars=20)
+        assert [s["text"] for s in first] == [s["text"] for s in second]
+        assert {s["segment_id"] for s in first}.isdisjoint(s["segment_id"] for s in second)
+        assert all(s["doc_id"] == "doc2" for s in second)
+
     def test_make_doc_record(self):
         rec = IngestorAgent.make_doc_record("http://x", "web", "hello")
         assert rec["uri"] == "http://x"
         assert rec["content_hash"]
 
+    def test_make_doc_record_hash_matches_connectors(self):
+        import hashlib
+        a = IngestorAgent.make_doc_record("http://x", "web", "hello")
+        b = IngestorAgent.make_doc_record("http://y", "web", "hello")
+        assert a["content_hash"] == b["content_hash"] == hashlib.sha256(b"hello").hexdigest()
+        assert a["doc_id"] != b["doc_id"]
+
 
 # --- Normalizer ---
 
+_NORMALIZER_RESPONSE = json.dumps({"normalized_segments": [{"segment_id": "s1", "text": "clean"}]})
+
+
 class TestNormalizer:
     def setup_method(self):
         self.agent = NormalizerAgent()
 
     def test_parse_valid(self):
-        resp = json.dumps({"normalized_segments": [{"segment_id": "s1", "text": "clean"}]})
-        result = self.agent.parse(resp)
+        result = self.agent.parse(_NORMALIZER_RESPONSE)
         assert len(result["normalized_segments"]) == 1
 
     def test_validate_valid(self):
@@ -71,6 +92,9 @@ class TestNormalizer:
         raw = "<p>Hello <b>world</b></p>"
         assert NormalizerAgent.normalize_text(raw) == "Hello world"
 
+    def test_normalize_text_plain_text_unchanged(self):
+        assert NormalizerAgent.normalize_text("a > b and c") == "a > b and c"
+
     def test_normalize_text_collapses_whitespace(self):
         raw = "Hello   \t  world\n\n\n\nParagraph"
         result = NormalizerAgent.normalize_text(raw)
@@ -80,16 +104,18 @@ class TestNormalizer:
 
 # --- Entity Resolver ---
 
+_ENTITY_RESOLVER_RESPONSE = json.dumps({
+    "entities": [{"entity_id": "e1", "type": "vendor", "names": ["Acme"]}],
+    "relationships": [{"rel_id": "r1", "type": "produces", "from_id": "e1", "to_id": "e2"}],
+})
+
+
 class TestEntityResolver:
     def setup_method(self):
         self.agent = EntityResolverAgent()
 
     def test_parse_valid(self):
-        resp = json.dumps({
-            "entities": [{"entity_id": "e1", "type": "vendor", "names": ["Acme"]}],
-            "relationships": [{"rel_id": "r1", "type": "produces", "from_id": "e1", "to_id": "e2"}],
-        })
-        result = self.agent.parse(resp)
+        result = self.agent.parse(_ENTITY_RESOLVER_RESPONSE)
         assert len(result["entities"]) == 1
         assert len(result["relationships"]) == 1
 
@@ -116,22 +142,24 @@ class TestEntityResolver:
 
 # --- Claim Extractor ---
 
+# Never mutated: _make_claim returns a new top-level dict for overrides.
+_BASE_CLAIM = {
+    "claim_id": "c1", "statement": "test", "claim_type": "factual",
+    "entities": [], "citations": [{"doc_id": "d1", "segment_id": "s1"}],
+    "evidence_strength": 0.9, "confidence": 0.9, "status": "active",
+}
+_CLAIM_EXTRACTOR_RESPONSE = json.dumps({"claims": [_BASE_CLAIM]})
+
+
 class TestClaimExtractor:
     def setup_method(self):
         self.agent = ClaimExtractorAgent()
 
     def _make_claim(self, **overrides):
-        base = {
-            "claim_id": "c1", "statement": "test", "claim_type": "factual",
-            "entities": [], "citations": [{"doc_id": "d1", "segment_id": "s1"}],
-            "evidence_strength": 0.9, "confidence": 0.9, "status": "active",
-        }
-        base.update(overrides)
-        return base
+        return {**_BASE_CLAIM, **overrides}
 
     def test_parse_valid(self):
-        resp = json.dumps({"claims": [self._make_claim()]})
-        result = self.agent.parse(resp)
+        result = self.agent.parse(_CLAIM_EXTRACTOR_RESPONSE)
         assert len(result["claims"]) == 1
 
     def test_validate_valid(self):
@@ -152,16 +180,18 @@ class TestClaimExtractor:
 
 # --- Metric Extractor ---
 
+_METRIC_EXTRACTOR_RESPONSE = json.dumps({
+    "metrics": [{"metric_id": "m1", "name": "latency", "unit": "ms"}],
+    "metric_points": [{"point_id": "p1", "metric_id": "m1", "t": "2026-01", "value": 42}],
+})
+
+
 class TestMetricExtractor:
     def setup_method(self):
         self.agent = MetricExtractorAgent()
 
     def test_parse_valid(self):
-        resp = json.dumps({
-            "metrics": [{"metric_id": "m1", "name": "latency", "unit": "ms"}],
-            "metric_points": [{"point_id": "p1", "metric_id": "m1", "t": "2026-01", "value": 42}],
-        })
-        result = self.agent.parse(resp)
+        result = self.agent.parse(_METRIC_EXTRACTOR_RESPONSE)
         assert len(result["metrics"]) == 1
 
     def test_validate_valid(self):
@@ -187,16 +217,18 @@ class TestMetricExtractor:
 
 # --- Contradiction ---
 
+_CONTRADICTION_RESPONSE = json.dumps({
+    "contradictions": [{"claim_a_id": "c1", "claim_b_id": "c2", "reason": "conflicting", "severity": "high"}],
+    "updated_claim_ids": ["c1", "c2"],
+})
+
+
 class TestContradiction:
     def setup_method(self):
         self.agent = ContradictionAgent()
 
     def test_parse_valid(self):
-        resp = json.dumps({
-            "contradictions": [{"claim_a_id": "c1", "claim_b_id": "c2", "reason": "conflicting", "severity": "high"}],
-            "updated_claim_ids": ["c1", "c2"],
-        })
-        result = self.agent.parse(resp)
+        result = self.agent.parse(_CONTRADICTION_RESPONSE)
         assert len(result["contradictions"]) == 1
 
     def test_validate_valid(self):
@@ -1,10 +1,17 @@
 """Tests for story-domain agents — parse/validate with sample inputs (Phase S1)."""
 
 import json
+import sqlite3
+from contextlib import contextmanager
 
 import pytest
 
-from data.db import get_initialized_connection
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None
+
+from data.db import get_connection, get_initialized_connection
 from data.dao_story_worlds import insert_world
 from data.dao_characters import insert_character
 from data.dao_threads import insert_thread
@@ -20,15 +27,45 @@ from agents.audience_compliance_agent import AudienceComplianceAgent
 from agents.narration_formatter_agent import NarrationFormatterAgent
 
 
+@contextmanager
+def _raises_with(msg: str, err: type[Exception] = ValueError):
+    """Like pytest.raises(err, match=...) but a plain substring check."""
+    with pytest.raises(err) as excinfo:
+        yield excinfo
+    assert msg in str(excinfo.value), f"{msg!r} not in {str(excinfo.value)!r}"
+
+
+def _dumps(obj) -> str:
+    """Serialize a sample model response, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 # ------------------------------------------------------------------
 # StoryMemoryLoaderAgent
 # ------------------------------------------------------------------
 
-class TestStoryMemoryLoader:
+def _copy_db(template):
+    """Page-copy a template DB into a fresh connection with the usual pragmas."""
+    conn = get_connection(":memory:")
+    template.backup(conn)
+    return conn
+
+
+@pytest.fixture(scope="session")
+def _schema_db():
+    """Empty schema, created once so tests never re-run the DDL."""
+    conn = get_initialized_connection(":memory:")
+    yield conn
+    conn.close()
 
-    @pytest.fixture
-    def populated_db(self):
-        conn = get_initialized_connection(":memory:")
+
+@pytest.fixture(scope="session")
+def _template_db(_schema_db):
+    """Story world built once and published through the shared-cache DB."""
+    conn = _copy_db(_schema_db)
+    with conn:  # one transaction for all fixture rows
         insert_world(
             conn,
             world_id="w1",
@@ -38,6 +75,7 @@ class TestStoryMemoryLoader:
             audience_profile={"age_range": "8-12", "vocabulary_level": "intermediate"},
             created_at="2026-01-01T00:00:00Z",
             updated_at="2026-01-01T00:00:00Z",
+            commit=False,
         )
         insert_character(
             conn,
@@ -46,6 +84,7 @@ class TestStoryMemoryLoader:
             name="Aria",
             role="protagonist",
             traits=["brave"],
+            commit=False,
         )
         insert_character(
             conn,
@@ -54,6 +93,7 @@ class TestStoryMemoryLoader:
             name="Bram",
             role="supporting",
             traits=["loyal"],
+            commit=False,
         )
         insert_thread(
             conn,
@@ -61,6 +101,7 @@ class TestStoryMemoryLoader:
             world_id="w1",
             title="The Missing Gem",
             introduced_in_episode=1,
+            commit=False,
         )
         insert_claim(
             conn,
@@ -70,6 +111,7 @@ class TestStoryMemoryLoader:
             statement="The gem is hidden in the cave",
             claim_type="canon_fact",
             first_seen_at="2026-01-01T00:00:00Z",
+            commit=False,
         )
         insert_snapshot(
             conn,
@@ -79,13 +121,71 @@ class TestStoryMemoryLoader:
             created_at="2026-01-01T00:00:00Z",
             hash="abc123",
             included_claim_ids=["cl1"],
+            commit=False,
         )
-        yield conn
-        conn.close()
+    yield conn
+    conn.close()
+
+
+_SHARED_WORLD_URI = "file:story_agents_world?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def _shared_world(_template_db):
+    # The shared-cache DB lives as long as one connection to it stays open.
+    holder = sqlite3.connect(_SHARED_WORLD_URI, uri=True)
+    _template_db.backup(holder)
+    yield holder
+    holder.close()
+
+
+@pytest.fixture(scope="class")
+def shared_world_db(_shared_world):
+    """Connection to the one shared story world, reused across a test class.
 
-    def test_loads_state_from_db(self, populated_db):
+    Only for tests that never write; writers use a private copy.
+    """
+    conn = sqlite3.connect(_SHARED_WORLD_URI, uri=True)
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.row_factory = sqlite3.Row
+    yield conn
+    conn.close()
+
+
+# Story tables, children before parents so the deletes satisfy foreign keys.
+_STORY_TABLES = (
+    "snapshots", "claims", "episodes", "narrative_threads", "characters", "story_worlds",
+)
+
+
+@pytest.fixture(scope="session")
+def _empty_conn(_schema_db):
+    conn = _copy_db(_schema_db)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def empty_db(_empty_conn):
+    """The one empty-schema connection, with its rows cleared after each test."""
+    yield _empty_conn
+    _empty_conn.rollback()
+    with _empty_conn:
+        for table in _STORY_TABLES:
+            _empty_conn.execute(f"DELETE FROM {table}")
+
+
+_EXPECTED_STATE_KEYS = (
+    "active_threads", "audience_profile", "characters", "episode_number",
+    "existing_claims", "previous_snapshot", "world_id", "world_state",
+)
+
+
+class TestStoryMemoryLoader:
+
+    def test_loads_state_from_db(self, shared_world_db):
         agent = StoryMemoryLoaderAgent()
-        state = {"conn": populated_db, "world_id": "w1"}
+        state = {"conn": shared_world_db, "world_id": "w1"}
         result = agent.run(state)
         assert result["world_id"] == "w1"
         assert result["world_state"]["name"] == "Eldoria"
@@ -96,27 +196,21 @@ class TestStoryMemoryLoader:
         assert result["episode_number"] == 1  # 0 + 1
         assert result["audience_profile"]["age_range"] == "8-12"
 
-    def test_correct_state_keys(self, populated_db):
+    def test_correct_state_keys(self, shared_world_db):
         agent = StoryMemoryLoaderAgent()
-        state = {"conn": populated_db, "world_id": "w1"}
+        state = {"conn": shared_world_db, "world_id": "w1"}
         result = agent.run(state)
-        expected_keys = {
-            "world_state", "characters", "active_threads",
-            "previous_snapshot", "existing_claims", "episode_number",
-            "audience_profile", "world_id",
-        }
-        assert set(result.keys()) == expected_keys
+        assert tuple(sorted(result)) == _EXPECTED_STATE_KEYS
 
-    def test_missing_world_raises(self, populated_db):
+    def test_missing_world_raises(self, shared_world_db):
         agent = StoryMemoryLoaderAgent()
-        state = {"conn": populated_db, "world_id": "nonexistent"}
-        with pytest.raises(ValueError, match="World not found"):
+        state = {"conn": shared_world_db, "world_id": "nonexistent"}
+        with _raises_with("World not found"):
             agent.run(state)
 
-    def test_empty_world_no_snapshot(self):
-        conn = get_initialized_connection(":memory:")
+    def test_empty_world_no_snapshot(self, empty_db):
         insert_world(
-            conn,
+            empty_db,
             world_id="w2",
             name="Empty",
             genre="scifi",
@@ -125,176 +219,131 @@ class TestStoryMemoryLoader:
             updated_at="2026-01-01T00:00:00Z",
         )
         agent = StoryMemoryLoaderAgent()
-        result = agent.run({"conn": conn, "world_id": "w2"})
+        result = agent.run({"conn": empty_db, "world_id": "w2"})
         assert result["characters"] == []
         assert result["active_threads"] == []
         assert result["previous_snapshot"] is None
         assert result["existing_claims"] == []
         assert result["episode_number"] == 1
-        conn.close()
 
 
 # ------------------------------------------------------------------
 # PremiseArchitectAgent
 # ------------------------------------------------------------------
 
-class TestPremiseArchitect:
+_PREMISE_RESPONSE = _dumps({
+    "premise": "Aria discovers a hidden map leading to the lost gem.",
+    "episode_title": "The Hidden Map",
+    "selected_threads": ["t1"],
+})
+
+
+# Known-good validate() inputs; tests override single fields with {**base, ...}.
+_VALID_PREMISE = {
+    "premise": "A quest begins.",
+    "episode_title": "The Quest",
+    "selected_threads": ["t1"],
+}
+
 
-    def setup_method(self):
-        self.agent = PremiseArchitectAgent()
+@pytest.fixture(scope="module")
+def premise_architect():
+    return PremiseArchitectAgent()
+
+
+class TestPremiseArchitect:
 
-    def test_parse_valid(self):
-        resp = json.dumps({
-            "premise": "Aria discovers a hidden map leading to the lost gem.",
-            "episode_title": "The Hidden Map",
-            "selected_threads": ["t1"],
-        })
-        result = self.agent.parse(resp)
+    def test_parse_valid(self, premise_architect):
+        result = premise_architect.parse(_PREMISE_RESPONSE)
         assert result["premise"] == "Aria discovers a hidden map leading to the lost gem."
         assert result["episode_title"] == "The Hidden Map"
         assert result["selected_threads"] == ["t1"]
 
-    def test_validate_valid(self):
-        self.agent.validate({
-            "premise": "A quest begins.",
-            "episode_title": "The Quest",
-            "selected_threads": ["t1"],
-        })
-
-    def test_validate_empty_premise(self):
-        with pytest.raises(ValueError, match="premise must be non-empty"):
-            self.agent.validate({
-                "premise": "",
-                "episode_title": "Title",
-                "selected_threads": [],
-            })
-
-    def test_validate_empty_title(self):
-        with pytest.raises(ValueError, match="episode_title must be non-empty"):
-            self.agent.validate({
-                "premise": "Some premise",
-                "episode_title": "",
-                "selected_threads": [],
-            })
+    def test_validate_valid(self, premise_architect):
+        premise_architect.validate(_VALID_PREMISE)
 
-    def test_validate_threads_not_list(self):
-        with pytest.raises(ValueError, match="selected_threads must be a list"):
-            self.agent.validate({
-                "premise": "Some premise",
-                "episode_title": "Title",
-                "selected_threads": "t1",
-            })
+    @pytest.mark.parametrize("override, match", [
+        pytest.param({"premise": ""}, "premise must be non-empty", id="empty-premise"),
+        pytest.param({"episode_title": ""}, "episode_title must be non-empty", id="empty-title"),
+        pytest.param({"selected_threads": "t1"}, "selected_threads must be a list", id="threads-not-list"),
+    ])
+    def test_validate_rejects(self, premise_architect, override, match):
+        with _raises_with(match):
+            premise_architect.validate({**_VALID_PREMISE, **override})
 
-    def test_validate_no_threads_ok(self):
+    def test_validate_no_threads_ok(self, premise_architect):
         """Empty list is OK — means new thread will be created."""
-        self.agent.validate({
-            "premise": "A new adventure.",
-            "episode_title": "New Thread",
-            "selected_threads": [],
-        })
+        premise_architect.validate({**_VALID_PREMISE, "selected_threads": []})
 
 
 # ------------------------------------------------------------------
 # PlotArchitectAgent
 # ------------------------------------------------------------------
 
-class TestPlotArchitect:
+_PLOT_RESPONSE = _dumps({
+    "act_structure": [
+        {"act": 1, "title": "Setup", "summary": "Intro"},
+        {"act": 2, "title": "Climax", "summary": "Conflict"},
+    ],
+    "scene_plans": [
+        {"scene_id": "s1", "act": 1, "pov_character": "Aria", "conflict": "c", "objective": "o", "stakes": "s", "emotional_arc": "e"},
+        {"scene_id": "s2", "act": 2, "pov_character": "Bram", "conflict": "c", "objective": "o", "stakes": "s", "emotional_arc": "e"},
+    ],
+})
 
-    def setup_method(self):
-        self.agent = PlotArchitectAgent()
-
-    def test_parse_valid(self):
-        resp = json.dumps({
-            "act_structure": [
-                {"act": 1, "title": "Setup", "summary": "Intro"},
-                {"act": 2, "title": "Climax", "summary": "Conflict"},
-            ],
-            "scene_plans": [
-                {"scene_id": "s1", "act": 1, "pov_character": "Aria", "conflict": "c", "objective": "o", "stakes": "s", "emotional_arc": "e"},
-                {"scene_id": "s2", "act": 2, "pov_character": "Bram", "conflict": "c", "objective": "o", "stakes": "s", "emotional_arc": "e"},
-            ],
-        })
-        result = self.agent.parse(resp)
-        assert len(result["act_structure"]) == 2
-        assert len(result["scene_plans"]) == 2
 
-    def test_validate_valid(self):
-        self.agent.validate({
-            "act_structure": [{"act": 1, "title": "A1"}, {"act": 2, "title": "A2"}],
-            "scene_plans": [
-                {"scene_id": "s1", "act": 1, "pov_character": "Aria"},
-                {"scene_id": "s2", "act": 2, "pov_character": "Bram"},
-            ],
-        })
-
-    def test_validate_empty_acts(self):
-        with pytest.raises(ValueError, match="act_structure must be a non-empty list"):
-            self.agent.validate({
-                "act_structure": [],
-                "scene_plans": [{"scene_id": "s1", "act": 1, "pov_character": "X"}],
-            })
+_SCENE_1 = {"scene_id": "s1", "act": 1, "pov_character": "Aria"}
+_SCENE_2 = {"scene_id": "s2", "act": 2, "pov_character": "Bram"}
+_VALID_PLOT = {
+    "act_structure": [{"act": 1, "title": "A1"}, {"act": 2, "title": "A2"}],
+    "scene_plans": [_SCENE_1, _SCENE_2],
+}
 
-    def test_validate_too_few_scenes(self):
-        with pytest.raises(ValueError, match="at least 2 scenes"):
-            self.agent.validate({
-                "act_structure": [{"act": 1}],
-                "scene_plans": [{"scene_id": "s1", "act": 1, "pov_character": "X"}],
-            })
 
-    def test_validate_act_without_scene(self):
-        with pytest.raises(ValueError, match="Act 2 has no scenes"):
-            self.agent.validate({
-                "act_structure": [{"act": 1}, {"act": 2}],
-                "scene_plans": [
-                    {"scene_id": "s1", "act": 1, "pov_character": "Aria"},
-                    {"scene_id": "s2", "act": 1, "pov_character": "Bram"},
-                ],
-            })
+@pytest.fixture(scope="module")
+def plot_architect():
+    return PlotArchitectAgent()
 
-    def test_validate_missing_scene_id(self):
-        with pytest.raises(ValueError, match="scene_id"):
-            self.agent.validate({
-                "act_structure": [{"act": 1}],
-                "scene_plans": [
-                    {"act": 1, "pov_character": "X"},
-                    {"scene_id": "s2", "act": 1, "pov_character": "Y"},
-                ],
-            })
 
-    def test_validate_missing_pov_character(self):
-        with pytest.raises(ValueError, match="pov_character"):
-            self.agent.validate({
-                "act_structure": [{"act": 1}],
-                "scene_plans": [
-                    {"scene_id": "s1", "act": 1},
-                    {"scene_id": "s2", "act": 1, "pov_character": "Y"},
-                ],
-            })
+class TestPlotArchitect:
 
-    def test_validate_with_characters_valid(self):
+    def test_parse_valid(self, plot_architect):
+        result = plot_architect.parse(_PLOT_RESPONSE)
+        assert len(result["act_structure"]) == 2
+        assert len(result["scene_plans"]) == 2
+
+    def test_validate_valid(self, plot_architect):
+        plot_architect.validate(_VALID_PLOT)
+
+    @pytest.mark.parametrize("override, match", [
+        pytest.param({"act_structure": []}, "act_structure must be a non-empty list", id="empty-acts"),
+        pytest.param({"scene_plans": [_SCENE_1]}, "at least 2 scenes", id="too-few-scenes"),
+        pytest.param(
+            {"scene_plans": [_SCENE_1, {**_SCENE_2, "act": 1}]}, "Act 2 has no scenes",
+            id="act-without-scene",
+        ),
+        pytest.param(
+            {"scene_plans": [{"act": 1, "pov_character": "X"}, _SCENE_2]}, "scene_id",
+            id="missing-scene-id",
+        ),
+        pytest.param(
+            {"scene_plans": [{"scene_id": "s1", "act": 1}, _SCENE_2]}, "pov_character",
+            id="missing-pov-character",
+        ),
+    ])
+    def test_validate_rejects(self, plot_architect, override, match):
+        with _raises_with(match):
+            plot_architect.validate({**_VALID_PLOT, **override})
+
+    def test_validate_with_characters_valid(self, plot_architect):
         chars = [{"name": "Aria"}, {"name": "Bram"}]
-        self.agent.validate_with_characters(
-            {
-                "act_structure": [{"act": 1}],
-                "scene_plans": [
-                    {"scene_id": "s1", "act": 1, "pov_character": "Aria"},
-                    {"scene_id": "s2", "act": 1, "pov_character": "Bram"},
-                ],
-            },
-            chars,
-        )
+        plot_architect.validate_with_characters(_VALID_PLOT, chars)
 
-    def test_validate_with_characters_unknown_pov(self):
+    def test_validate_with_characters_unknown_pov(self, plot_architect):
         chars = [{"name": "Aria"}]
-        with pytest.raises(ValueError, match="not found in character list"):
-            self.agent.validate_with_characters(
-                {
-                    "act_structure": [{"act": 1}],
-                    "scene_plans": [
-                        {"scene_id": "s1", "act": 1, "pov_character": "Aria"},
-                        {"scene_id": "s2", "act": 1, "pov_character": "Unknown"},
-                    ],
-                },
+        with _raises_with("not found in character list"):
+            plot_architect.validate_with_characters(
+                {**_VALID_PLOT, "scene_plans": [_SCENE_1, {**_SCENE_2, "pov_character": "Unknown"}]},
                 chars,
             )
 
@@ -303,59 +352,55 @@ class TestPlotArchitect:
 # SceneWriterAgent
 # ------------------------------------------------------------------
 
-class TestSceneWriter:
+_SCENE_WRITER_RESPONSE = _dumps({
+    "scenes": [
+        {"scene_id": "s1", "text": "Once upon a time...", "word_count": 150},
+        {"scene_id": "s2", "text": "And then...", "word_count": 200},
+    ],
+    "episode_text": "Once upon a time... And then...",
+})
 
-    def setup_method(self):
-        self.agent = SceneWriterAgent()
-
-    def test_parse_valid(self):
-        resp = json.dumps({
-            "scenes": [
-                {"scene_id": "s1", "text": "Once upon a time...", "word_count": 150},
-                {"scene_id": "s2", "text": "And then...", "word_count": 200},
-            ],
-            "episode_text": "Once upon a time... And then...",
-        })
-        result = self.agent.parse(resp)
-        assert len(result["scenes"]) == 2
-        assert result["episode_text"] == "Once upon a time... And then..."
 
-    def test_validate_valid(self):
-        self.agent.validate({
-            "scenes": [
-                {"scene_id": "s1", "text": "Some text", "word_count": 100},
-            ],
-            "episode_text": "Some text",
-        })
-
-    def test_validate_empty_scenes(self):
-        with pytest.raises(ValueError, match="non-empty list"):
-            self.agent.validate({"scenes": [], "episode_text": "text"})
-
-    def test_validate_missing_text(self):
-        with pytest.raises(ValueError, match="has no text"):
-            self.agent.validate({
-                "scenes": [{"scene_id": "s1", "text": "", "word_count": 0}],
-                "episode_text": "text",
-            })
+_VALID_SCENES = {
+    "scenes": [{"scene_id": "s1", "text": "Some text", "word_count": 100}],
+    "episode_text": "Some text",
+}
 
-    def test_validate_bad_word_count(self):
-        with pytest.raises(ValueError, match="invalid word_count"):
-            self.agent.validate({
-                "scenes": [{"scene_id": "s1", "text": "words", "word_count": 0}],
-                "episode_text": "words",
-            })
 
-    def test_validate_empty_episode_text(self):
-        with pytest.raises(ValueError, match="episode_text must be non-empty"):
-            self.agent.validate({
-                "scenes": [{"scene_id": "s1", "text": "words", "word_count": 5}],
-                "episode_text": "",
-            })
+@pytest.fixture(scope="module")
+def scene_writer():
+    return SceneWriterAgent()
+
+
+class TestSceneWriter:
 
-    def test_validate_scene_ids_all_present(self):
+    def test_parse_valid(self, scene_writer):
+        result = scene_writer.parse(_SCENE_WRITER_RESPONSE)
+        assert len(result["scenes"]) == 2
+        assert result["episode_text"] == "Once upon a time... And then..."
+
+    def test_validate_valid(self, scene_writer):
+        scene_writer.validate(_VALID_SCENES)
+
+    @pytest.mark.parametrize("override, match", [
+        pytest.param({"scenes": []}, "non-empty list", id="empty-scenes"),
+        pytest.param(
+            {"scenes": [{"scene_id": "s1", "text": "", "word_count": 0}]}, "has no text",
+            id="missing-text",
+        ),
+        pytest.param(
+            {"scenes": [{"scene_id": "s1", "text": "words", "word_count": 0}]}, "invalid word_count",
+            id="bad-word-count",
+        ),
+        pytest.param({"episode_text": ""}, "episode_text must be non-empty", id="empty-episode-text"),
+    ])
+    def test_validate_rejects(self, scene_writer, override, match):
+        with _raises_with(match):
+            scene_writer.validate({**_VALID_SCENES, **override})
+
+    def test_validate_scene_ids_all_present(self, scene_writer):
         plans = [{"scene_id": "s1"}, {"scene_id": "s2"}]
-        self.agent.validate_scene_ids(
+        scene_writer.validate_scene_ids(
             {
                 "scenes": [
                     {"scene_id": "s1", "text": "A", "word_count": 1},
@@ -366,10 +411,10 @@ class TestSceneWriter:
             plans,
         )
 
-    def test_validate_scene_ids_missing(self):
+    def test_validate_scene_ids_missing(self, scene_writer):
         plans = [{"scene_id": "s1"}, {"scene_id": "s2"}, {"scene_id": "s3"}]
-        with pytest.raises(ValueError, match="Missing scenes from plan"):
-            self.agent.validate_scene_ids(
+        with _raises_with("Missing scenes from plan"):
+            scene_writer.validate_scene_ids(
                 {
                     "scenes": [
                         {"scene_id": "s1", "text": "A", "word_count": 1},
@@ -384,258 +429,210 @@ class TestSceneWriter:
 # CanonUpdaterAgent
 # ------------------------------------------------------------------
 
-class TestCanonUpdater:
+_CANON_UPDATE_RESPONSE = _dumps({
+    "new_claims": [
+        {
+            "claim_id": "cl-new-1",
+            "statement": "The cave contains a dragon",
+            "claim_type": "canon_fact",
+            "entities": ["dragon"],
+            "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
+            "evidence_strength": 0.9,
+            "confidence": 0.95,
+        }
+    ],
+    "updated_characters": [{"character_id": "c1", "changes": {"beliefs": ["dragons exist"]}}],
+    "new_threads": [{"title": "Dragon Threat", "thematic_tag": "danger", "related_character_ids": ["c1"]}],
+    "resolved_threads": ["t1"],
+    "new_entities": [{"entity_id": "dragon-1", "type": "creature", "name": "Fyrax"}],
+})
+
+
+# Templates for validate() tests. validate() may rewrite claims in place,
+# so every test builds its own claim dict from _VALID_CLAIM.
+_VALID_CLAIM = {
+    "claim_id": "cl1",
+    "statement": "Fact",
+    "claim_type": "canon_fact",
+    "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
+}
+_EMPTY_CANON_UPDATE = {
+    "new_claims": [],
+    "updated_characters": [],
+    "new_threads": [],
+    "resolved_threads": [],
+    "new_entities": [],
+}
+
+
+@pytest.fixture(scope="module")
+def canon_updater():
+    return CanonUpdaterAgent()
 
-    def setup_method(self):
-        self.agent = CanonUpdaterAgent()
 
-    def test_parse_valid(self):
-        resp = json.dumps({
-            "new_claims": [
-                {
-                    "claim_id": "cl-new-1",
-                    "statement": "The cave contains a dragon",
-                    "claim_type": "canon_fact",
-                    "entities": ["dragon"],
-                    "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
-                    "evidence_strength": 0.9,
-                    "confidence": 0.95,
-                }
-            ],
-            "updated_characters": [{"character_id": "c1", "changes": {"beliefs": ["dragons exist"]}}],
-            "new_threads": [{"title": "Dragon Threat", "thematic_tag": "danger", "related_character_ids": ["c1"]}],
-            "resolved_threads": ["t1"],
-            "new_entities": [{"entity_id": "dragon-1", "type": "creature", "name": "Fyrax"}],
-        })
-        result = self.agent.parse(resp)
+class TestCanonUpdater:
+
+    def test_parse_valid(self, canon_updater):
+        result = canon_updater.parse(_CANON_UPDATE_RESPONSE)
         assert len(result["new_claims"]) == 1
         assert len(result["updated_characters"]) == 1
         assert len(result["new_threads"]) == 1
         assert result["resolved_threads"] == ["t1"]
         assert len(result["new_entities"]) == 1
 
-    def test_validate_valid(self):
-        self.agent.validate({
-            "new_claims": [
-                {
-                    "claim_id": "cl1",
-                    "statement": "Fact",
-                    "claim_type": "canon_fact",
-                    "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
-                }
-            ],
-            "updated_characters": [],
-            "new_threads": [],
-            "resolved_threads": [],
-            "new_entities": [],
-        })
-
-    def test_validate_invalid_claim_type(self):
-        with pytest.raises(ValueError, match="invalid claim_type"):
-            self.agent.validate({
-                "new_claims": [
-                    {
-                        "claim_id": "cl1",
-                        "statement": "Fact",
-                        "claim_type": "bogus_type",
-                        "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
-                    }
-                ],
-                "updated_characters": [],
-                "new_threads": [],
-                "resolved_threads": [],
-                "new_entities": [],
+    def test_validate_valid(self, canon_updater):
+        canon_updater.validate({**_EMPTY_CANON_UPDATE, "new_claims": [{**_VALID_CLAIM}]})
+
+    @pytest.mark.parametrize("claim_override, match", [
+        pytest.param({"claim_type": "bogus_type"}, "invalid claim_type", id="invalid-claim-type"),
+        pytest.param({"statement": "", "claim_type": "event"}, "no statement", id="missing-statement"),
+        pytest.param({"claim_type": ["event"]}, "invalid claim_type", id="unhashable-claim-type"),
+    ])
+    def test_validate_rejects(self, canon_updater, claim_override, match):
+        with _raises_with(match):
+            canon_updater.validate({
+                **_EMPTY_CANON_UPDATE, "new_claims": [{**_VALID_CLAIM, **claim_override}],
             })
 
-    def test_validate_missing_citations_reclassifies_as_belief(self):
+    def test_validate_missing_citations_reclassifies_as_belief(self, canon_updater):
         """Claims without citations are auto-reclassified as beliefs, not rejected."""
         output = {
-            "new_claims": [
-                {
-                    "claim_id": "cl1",
-                    "statement": "Fact",
-                    "claim_type": "event",
-                    "citations": [],
-                }
-            ],
-            "updated_characters": [],
-            "new_threads": [],
-            "resolved_threads": [],
-            "new_entities": [],
+            **_EMPTY_CANON_UPDATE,
+            "new_claims": [{**_VALID_CLAIM, "claim_type": "event", "citations": []}],
         }
-        self.agent.validate(output)
+        canon_updater.validate(output)
         assert output["new_claims"][0]["claim_type"] == "belief"
         assert "_note" in output["new_claims"][0]
 
-    def test_validate_belief_and_legend_without_citations(self):
+    def test_validate_belief_and_legend_without_citations(self, canon_updater):
         """Belief and legend claim types don't need citations."""
         for ct in ("belief", "legend"):
             output = {
-                "new_claims": [
-                    {
-                        "claim_id": f"cl-{ct}",
-                        "statement": "An old tale",
-                        "claim_type": ct,
-                        "citations": [],
-                    }
-                ],
-                "updated_characters": [],
-                "new_threads": [],
-                "resolved_threads": [],
-                "new_entities": [],
+                **_EMPTY_CANON_UPDATE,
+                "new_claims": [{
+                    **_VALID_CLAIM, "claim_id": f"cl-{ct}", "statement": "An old tale",
+                    "claim_type": ct, "citations": [],
+                }],
             }
-            self.agent.validate(output)
+            canon_updater.validate(output)
             assert output["new_claims"][0]["claim_type"] == ct
 
-    def test_validate_all_claim_types(self):
-        for ct in ("canon_fact", "world_rule", "character_trait", "event", "belief", "legend"):
-            self.agent.validate({
-                "new_claims": [
-                    {
-                        "claim_id": f"cl-{ct}",
-                        "statement": "Fact",
-                        "claim_type": ct,
-                        "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
-                    }
-                ],
-                "updated_characters": [],
-                "new_threads": [],
-                "resolved_threads": [],
-                "new_entities": [],
-            })
-
-    def test_validate_missing_statement(self):
-        with pytest.raises(ValueError, match="no statement"):
-            self.agent.validate({
-                "new_claims": [
-                    {
-                        "claim_id": "cl1",
-                        "statement": "",
-                        "claim_type": "event",
-                        "citations": [{"doc_id": "ep1", "segment_id": "s1"}],
-                    }
-                ],
-                "updated_characters": [],
-                "new_threads": [],
-                "resolved_threads": [],
-                "new_entities": [],
-            })
+    @pytest.mark.parametrize(
+        "ct", ["canon_fact", "world_rule", "character_trait", "event", "belief", "legend"],
+    )
+    def test_validate_all_claim_types(self, canon_updater, ct):
+        claim = {**_VALID_CLAIM, "claim_id": f"cl-{ct}", "claim_type": ct}
+        canon_updater.validate({**_EMPTY_CANON_UPDATE, "new_claims": [claim]})
 
 
 # ------------------------------------------------------------------
 # AudienceComplianceAgent
 # ------------------------------------------------------------------
 
-class TestAudienceCompliance:
+_COMPLIANCE_PASS_RESPONSE = _dumps({
+    "compliance_status": "PASS",
+    "compliance_violations": [],
+})
+_COMPLIANCE_FAIL_RESPONSE = _dumps({
+    "compliance_status": "FAIL",
+    "compliance_violations": [
+        {"rule": "vocabulary", "detail": "Too complex", "scene_id": "s1"}
+    ],
+})
+
+
+_VALID_COMPLIANCE_PASS = {"compliance_status": "PASS", "compliance_violations": []}
+_VALID_COMPLIANCE_FAIL = {
+    "compliance_status": "FAIL",
+    "compliance_violations": [
+        {"rule": "vocabulary", "detail": "Too complex", "scene_id": "s1"}
+    ],
+}
+
 
-    def setup_method(self):
-        self.agent = AudienceComplianceAgent()
+@pytest.fixture(scope="module")
+def audience_compliance():
+    return AudienceComplianceAgent()
 
-    def test_parse_pass(self):
-        resp = json.dumps({
-            "compliance_status": "PASS",
-            "compliance_violations": [],
-        })
-        result = self.agent.parse(resp)
+
+class TestAudienceCompliance:
+
+    def test_parse_pass(self, audience_compliance):
+        result = audience_compliance.parse(_COMPLIANCE_PASS_RESPONSE)
         assert result["compliance_status"] == "PASS"
         assert result["compliance_violations"] == []
 
-    def test_parse_fail(self):
-        resp = json.dumps({
-            "compliance_status": "FAIL",
-            "compliance_violations": [
-                {"rule": "vocabulary", "detail": "Too complex", "scene_id": "s1"}
-            ],
-        })
-        result = self.agent.parse(resp)
+    def test_parse_fail(self, audience_compliance):
+        result = audience_compliance.parse(_COMPLIANCE_FAIL_RESPONSE)
         assert result["compliance_status"] == "FAIL"
         assert len(result["compliance_violations"]) == 1
 
-    def test_validate_pass(self):
-        self.agent.validate({
-            "compliance_status": "PASS",
-            "compliance_violations": [],
-        })
-
-    def test_validate_fail_with_violations(self):
-        self.agent.validate({
-            "compliance_status": "FAIL",
-            "compliance_violations": [
-                {"rule": "vocabulary", "detail": "Too complex", "scene_id": "s1"}
-            ],
-        })
-
-    def test_validate_invalid_status(self):
-        with pytest.raises(ValueError, match="must be 'PASS' or 'FAIL'"):
-            self.agent.validate({
-                "compliance_status": "MAYBE",
-                "compliance_violations": [],
-            })
-
-    def test_validate_fail_without_violations(self):
-        with pytest.raises(ValueError, match="must include at least one violation"):
-            self.agent.validate({
-                "compliance_status": "FAIL",
-                "compliance_violations": [],
-            })
-
-    def test_validate_violation_missing_rule(self):
-        with pytest.raises(ValueError, match="must have a 'rule' field"):
-            self.agent.validate({
-                "compliance_status": "FAIL",
-                "compliance_violations": [{"detail": "Bad stuff"}],
-            })
-
-    def test_validate_violation_missing_detail(self):
-        with pytest.raises(ValueError, match="must have a 'detail' field"):
-            self.agent.validate({
-                "compliance_status": "FAIL",
-                "compliance_violations": [{"rule": "vocabulary"}],
-            })
+    def test_validate_pass(self, audience_compliance):
+        audience_compliance.validate(_VALID_COMPLIANCE_PASS)
+
+    def test_validate_fail_with_violations(self, audience_compliance):
+        audience_compliance.validate(_VALID_COMPLIANCE_FAIL)
+
+    @pytest.mark.parametrize("override, match", [
+        pytest.param({"compliance_status": "MAYBE"}, "must be 'PASS' or 'FAIL'", id="invalid-status"),
+        pytest.param(
+            {"compliance_violations": []}, "must include at least one violation",
+            id="fail-without-violations",
+        ),
+        pytest.param(
+            {"compliance_violations": [{"detail": "Bad stuff"}]}, "must have a 'rule' field",
+            id="violation-missing-rule",
+        ),
+        pytest.param(
+            {"compliance_violations": [{"rule": "vocabulary"}]}, "must have a 'detail' field",
+            id="violation-missing-detail",
+        ),
+    ])
+    def test_validate_rejects(self, audience_compliance, override, match):
+        with _raises_with(match):
+            audience_compliance.validate({**_VALID_COMPLIANCE_FAIL, **override})
 
 
 # ------------------------------------------------------------------
 # NarrationFormatterAgent
 # ------------------------------------------------------------------
 
-class TestNarrationFormatter:
+_NARRATION_RESPONSE = _dumps({
+    "narration_script": "[NARRATOR] Once upon a time...\n[VOICE: Aria] Hello!",
+    "recap": "Previously on Eldoria: Aria found a mysterious map.",
+})
+
+
+_VALID_NARRATION = {"narration_script": "Some narration", "recap": "Previously..."}
+
 
-    def setup_method(self):
-        self.agent = NarrationFormatterAgent()
+@pytest.fixture(scope="module")
+def narration_formatter():
+    return NarrationFormatterAgent()
 
-    def test_parse_valid(self):
-        resp = json.dumps({
-            "narration_script": "[NARRATOR] Once upon a time...\n[VOICE: Aria] Hello!",
-            "recap": "Previously on Eldoria: Aria found a mysterious map.",
-        })
-        result = self.agent.parse(resp)
+
+class TestNarrationFormatter:
+
+    def test_parse_valid(self, narration_formatter):
+        result = narration_formatter.parse(_NARRATION_RESPONSE)
         assert "[NARRATOR]" in result["narration_script"]
         assert "Previously" in result["recap"]
 
-    def test_validate_valid(self):
-        self.agent.validate({
-            "narration_script": "Some narration",
-            "recap": "Previously...",
-        })
-
-    def test_validate_empty_narration(self):
-        with pytest.raises(ValueError, match="narration_script must be non-empty"):
-            self.agent.validate({
-                "narration_script": "",
-                "recap": "Previously...",
-            })
+    def test_validate_valid(self, narration_formatter):
+        narration_formatter.validate({**_VALID_NARRATION})
 
-    def test_validate_empty_recap_gets_default(self):
-        output = {
-            "narration_script": "Some narration",
-            "recap": "",
-        }
-        self.agent.validate(output)
+    def test_validate_empty_narration(self, narration_formatter):
+        with _raises_with("narration_script must be non-empty"):
+            narration_formatter.validate({**_VALID_NARRATION, "narration_script": ""})
+
+    def test_validate_empty_recap_gets_default(self, narration_formatter):
+        output = {**_VALID_NARRATION, "recap": ""}
+        narration_formatter.validate(output)
         assert output["recap"] == "The story begins..."
 
-    def test_parse_freeform_text(self):
+    def test_parse_freeform_text(self, narration_formatter):
         """Non-JSON freeform narration is accepted as narration_script."""
         freeform = "[NARRATOR] The ship drifted silently.\n[VOICE: Kael] Check the readings."
-        result = self.agent.parse(freeform)
+        result = narration_formatter.parse(freeform)
         assert result["narration_script"] == freeform
         assert result["recap"] == ""
@@ -1,13 +1,15 @@
 """Tests for story publishing (Phase S3): artifact structure, manifest, hashes, format."""
 
+import functools
 import hashlib
 import json
-import shutil
+import re
 from pathlib import Path
 
 import pytest
 
 from agents import registry
+from agents.base_agent import loads_json
 from agents.story_memory_loader_agent import StoryMemoryLoaderAgent
 from agents.premise_architect_agent import PremiseArchitectAgent
 from agents.plot_architect_agent import PlotArchitectAgent
@@ -18,13 +20,11 @@ from agents.narration_formatter_agent import NarrationFormatterAgent
 from agents.contradiction_agent import ContradictionAgent
 from agents.qa_validator_agent import QAValidatorAgent
 from agents.delta_agent import DeltaAgent
-from agents.publisher_agent import PublisherAgent, PUBLISH_ROOT
+from agents import publisher_agent
+from agents.publisher_agent import PublisherAgent
 from core.orchestrator import execute_graph
 from core.state import create_initial_state
-from data.db import get_initialized_connection
-from data.dao_story_worlds import insert_world
-from data.dao_characters import insert_character
-from data.dao_threads import insert_thread
+from data.db import get_connection
 from graphs.graph_types import load_graph
 from publish.renderer import (
     render_story_markdown,
@@ -34,6 +34,8 @@ from publish.renderer import (
 )
 
 GRAPH_PATH = Path(__file__).parent.parent.parent / "graphs" / "story_graph.yaml"
+# execute_graph only reads the graph, so one parse serves every run.
+_GRAPH = load_graph(GRAPH_PATH)
 
 
 # ---- Shared mock model ----
@@ -90,37 +92,22 @@ _MOCK_RESPONSES = {
 }
 
 
+_MOCK_KEY_RE = re.compile("|".join(map(re.escape, _MOCK_RESPONSES)), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
 def _mock_model(system_prompt: str, user_message: str) -> str:
-    for key, response in _MOCK_RESPONSES.items():
-        if key in system_prompt.lower():
-            return response
-    return json.dumps({})
-
-
-@pytest.fixture
-def story_db():
-    conn = get_initialized_connection(":memory:")
-    now = "2026-01-01T00:00:00Z"
-    insert_world(
-        conn, world_id="eldoria-1", name="Eldoria", genre="fantasy", tone="whimsical",
-        setting={"geography": "Floating islands"},
-        thematic_constraints=["friendship", "courage"],
-        audience_profile={"age_range": "8-12", "vocabulary_level": "intermediate"},
-        created_at=now, updated_at=now,
-    )
-    insert_character(conn, character_id="char-aria", world_id="eldoria-1",
-                     name="Aria", role="protagonist", traits=["brave", "curious"])
-    insert_character(conn, character_id="char-bram", world_id="eldoria-1",
-                     name="Bram", role="supporting", traits=["loyal", "cautious"])
-    insert_thread(conn, thread_id="thread-crystal-storms", world_id="eldoria-1",
-                  title="The Crystal Storms", introduced_in_episode=0,
-                  thematic_tag="mystery", related_character_ids=["char-aria"])
-    yield conn
-    conn.close()
+    m = _MOCK_KEY_RE.search(system_prompt)
+    return _MOCK_RESPONSES[m.group(0).lower()] if m else "{}"
+
 
+def _read_json(path: Path):
+    return loads_json(path.read_bytes())
 
-@pytest.fixture(autouse=True)
-def setup_and_cleanup():
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_agents():
+    # Agents are stateless between runs, so one registration serves the module.
     registry.clear()
     registry.register(StoryMemoryLoaderAgent())
     registry.register(PremiseArchitectAgent())
@@ -135,14 +122,10 @@ def setup_and_cleanup():
     registry.register(PublisherAgent())
     yield
     registry.clear()
-    out_dir = PUBLISH_ROOT / "story"
-    if out_dir.exists():
-        shutil.rmtree(out_dir)
 
 
 def _run_story_graph(story_db, run_id="pub-test-1"):
     """Helper: run the story graph and return result + publish_dir."""
-    graph = load_graph(GRAPH_PATH)
     state = create_initial_state(
         scope_type="story", scope_id="eldoria-1",
         run_id=run_id, graph_id="story_graph",
@@ -152,19 +135,32 @@ def _run_story_graph(story_db, run_id="pub-test-1"):
             "claims": [], "metrics": [], "doc_ids": [], "segment_ids": [], "violations": [],
         },
     )
-    result = execute_graph(graph, state, model_call=_mock_model)
+    result = execute_graph(_GRAPH, state, model_call=_mock_model)
     assert result.status == "completed"
     return result, Path(result.state["publish_dir"])
 
 
+@pytest.fixture(scope="module")
+def story_db_module(story_db_template):
+    conn = get_connection(":memory:")
+    story_db_template.backup(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def published_dir(story_db_module):
+    """One published E001 episode, shared by the read-only artifact tests."""
+    _, publish_dir = _run_story_graph(story_db_module)
+    return publish_dir
+
+
 # ------------------------------------------------------------------
 # S3.3 Golden test: artifact structure
 # ------------------------------------------------------------------
 
-def test_story_publish_artifact_structure(story_db):
+def test_story_publish_artifact_structure(published_dir):
     """Verify story publish produces all expected files."""
-    result, publish_dir = _run_story_graph(story_db)
-
     expected_files = [
         "manifest.json",
         "artifacts.json",
@@ -176,17 +172,16 @@ def test_story_publish_artifact_structure(story_db):
         "world_state.json",
     ]
     for fname in expected_files:
-        assert (publish_dir / fname).exists(), f"Missing: {fname}"
+        assert (published_dir / fname).exists(), f"Missing: {fname}"
 
 
 # ------------------------------------------------------------------
 # Manifest.json schema validation
 # ------------------------------------------------------------------
 
-def test_story_manifest_schema(story_db):
+def test_story_manifest_schema(published_dir):
     """Verify manifest.json has required fields for story publishes."""
-    _, publish_dir = _run_story_graph(story_db)
-    manifest = json.loads((publish_dir / "manifest.json").read_bytes())
+    manifest = _read_json(published_dir / "manifest.json")
 
     assert manifest["scope_type"] == "story"
     assert manifest["scope_id"] == "eldoria-1"
@@ -200,10 +195,9 @@ def test_story_manifest_schema(story_db):
 # Artifacts.json integrity: paths exist, hashes match
 # ------------------------------------------------------------------
 
-def test_story_artifacts_integrity(story_db):
+def test_story_artifacts_integrity(published_dir):
     """Verify every artifact listed in artifacts.json exists and hash matches."""
-    _, publish_dir = _run_story_graph(story_db)
-    artifacts = json.loads((publish_dir / "artifacts.json").read_bytes())
+    artifacts = _read_json(published_dir / "artifacts.json")
 
     assert len(artifacts) > 0
     for art in artifacts:
@@ -211,13 +205,13 @@ def test_story_artifacts_integrity(story_db):
         assert "path" in art
         assert "hash" in art
 
-        art_path = Path(art["path"])
-        assert art_path.exists(), f"Artifact path missing: {art['path']}"
-
-        content = art_path.read_bytes()
-        actual_hash = hashlib.sha256(content).hexdigest()
-        assert actual_hash == art["hash"], (
-            f"Hash mismatch for {art['name']}: expected {art['hash']}, got {actual_hash}"
+        try:
+            with open(art["path"], "rb") as f:
+                actual = hashlib.file_digest(f, "sha256").digest()
+        except FileNotFoundError:
+            pytest.fail(f"Artifact path missing: {art['path']}")
+        assert actual == bytes.fromhex(art["hash"]), (
+            f"Hash mismatch for {art['name']}: expected {art['hash']}, got {actual.hex()}"
         )
 
 
@@ -225,10 +219,9 @@ def test_story_artifacts_integrity(story_db):
 # Episode.md readable format
 # ------------------------------------------------------------------
 
-def test_episode_md_format(story_db):
+def test_episode_md_format(published_dir):
     """Verify episode.md has expected structure: title, scenes, word count."""
-    _, publish_dir = _run_story_graph(story_db)
-    content = (publish_dir / "episode.md").read_text(encoding="utf-8")
+    content = (published_dir / "episode.md").read_text(encoding="utf-8")
 
     # Title
     assert "# Episode:" in content
@@ -250,10 +243,9 @@ def test_episode_md_format(story_db):
 # episode.json structure
 # ------------------------------------------------------------------
 
-def test_episode_json_structure(story_db):
+def test_episode_json_structure(published_dir):
     """Verify episode.json has structured episode data."""
-    _, publish_dir = _run_story_graph(story_db)
-    ep = json.loads((publish_dir / "episode.json").read_bytes())
+    ep = _read_json(published_dir / "episode.json")
 
     assert ep["episode_title"] == "The Shard of Storms"
     assert ep["episode_number"] == 1
@@ -270,10 +262,9 @@ def test_episode_json_structure(story_db):
 # narration_script.txt
 # ------------------------------------------------------------------
 
-def test_narration_script_txt(story_db):
+def test_narration_script_txt(published_dir):
     """Verify narration_script.txt is plain text with narration markers."""
-    _, publish_dir = _run_story_graph(story_db)
-    content = (publish_dir / "narration_script.txt").read_text(encoding="utf-8")
+    content = (published_dir / "narration_script.txt").read_text(encoding="utf-8")
 
     assert "[NARRATOR]" in content
     assert "[VOICE:" in content
@@ -283,10 +274,9 @@ def test_narration_script_txt(story_db):
 # recap.md
 # ------------------------------------------------------------------
 
-def test_recap_md(story_db):
+def test_recap_md(published_dir):
     """Verify recap.md has 'Previously On' content."""
-    _, publish_dir = _run_story_graph(story_db)
-    content = (publish_dir / "recap.md").read_text(encoding="utf-8")
+    content = (published_dir / "recap.md").read_text(encoding="utf-8")
 
     assert "Previously On" in content
     assert "Eldoria" in content
@@ -296,10 +286,9 @@ def test_recap_md(story_db):
 # world_state.json
 # ------------------------------------------------------------------
 
-def test_world_state_json(story_db):
+def test_world_state_json(published_dir):
     """Verify world_state.json has characters, threads, and claim summary."""
-    _, publish_dir = _run_story_graph(story_db)
-    ws = json.loads((publish_dir / "world_state.json").read_bytes())
+    ws = _read_json(published_dir / "world_state.json")
 
     assert ws["world_id"] == "eldoria-1"
     assert ws["name"] == "Eldoria"
@@ -315,8 +304,11 @@ def test_world_state_json(story_db):
 # Multi-episode publish: E001 and E002 in separate directories
 # ------------------------------------------------------------------
 
-def test_multi_episode_separate_directories(story_db):
+def test_multi_episode_separate_directories(story_db, tmp_path, monkeypatch):
     """Verify E001 and E002 publish to separate version directories."""
+    # Own root, so this run's E001 does not overwrite published_dir's.
+    monkeypatch.setattr(publisher_agent, "PUBLISH_ROOT", tmp_path)
+
     # Run episode 1
     _, pub1 = _run_story_graph(story_db, run_id="pub-ep1")
     assert "E001" in str(pub1)
@@ -342,8 +334,8 @@ def test_multi_episode_separate_directories(story_db):
     assert pub1 != pub2
 
     # Both have manifests
-    m1 = json.loads((pub1 / "manifest.json").read_bytes())
-    m2 = json.loads((pub2 / "manifest.json").read_bytes())
+    m1 = _read_json(pub1 / "manifest.json")
+    m2 = _read_json(pub2 / "manifest.json")
     assert m1["version"] == "E001"
     assert m2["version"] == "E002"
 
@@ -35,15 +35,20 @@ VALID_TASK = textwrap.dedent("""\
     ## SUCCESS CRITERIA
 
     All auth flows covered; no external deps.
-""")
+""").encode("utf-8")
 
 
-class TestParseTaskFile:
-    def test_valid_task(self, tmp_path):
-        f = tmp_path / "2026-02-17-001.md"
-        f.write_text(VALID_TASK)
+@pytest.fixture(scope="module")
+def valid_task_parsed(tmp_path_factory):
+    """VALID_TASK parsed once; tests must only read it."""
+    f = tmp_path_factory.mktemp("valid_task") / "2026-02-17-001.md"
+    f.write_bytes(VALID_TASK)
+    return parse_task_file(f)
 
-        task = parse_task_file(f)
+
+class TestParseTaskFile:
+    def test_valid_task(self, valid_task_parsed):
+        task = valid_task_parsed
 
         assert isinstance(task, TaskFile)
         assert task.header.task_id == "2026-02-17-001"
@@ -60,11 +65,11 @@ class TestParseTaskFile:
 
     def test_with_parent_task(self, tmp_path):
         text = VALID_TASK.replace(
-            "# CREATED_AT: 2026-02-17T10:00:00",
-            "# CREATED_AT: 2026-02-17T10:00:00\n# PARENT_TASK: 2026-02-16-005",
+            b"# CREATED_AT: 2026-02-17T10:00:00",
+            b"# CREATED_AT: 2026-02-17T10:00:00\n# PARENT_TASK: 2026-02-16-005",
         )
         f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
+        f.write_bytes(text)
 
         task = parse_task_file(f)
         assert task.header.parent_task == "2026-02-16-005"
@@ -88,9 +93,9 @@ class TestParseTaskFile:
             ## SUCCESS CRITERIA
 
             It works.
-        """)
+        """).encode("utf-8")
         f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
+        f.write_bytes(text)
 
         with pytest.raises(ValueError, match="Missing required headers.*MODE"):
             parse_task_file(f)
@@ -107,9 +112,9 @@ class TestParseTaskFile:
             ## CONTEXT
 
             Some context.
-        """)
+        """).encode("utf-8")
         f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
+        f.write_bytes(text)
 
         with pytest.raises(ValueError, match="Missing required sections"):
             parse_task_file(f)
@@ -123,19 +128,26 @@ class TestGenerateTaskId:
 
     def test_increments_sequence(self, tmp_path):
         today = date.today().isoformat()
-        (tmp_path / f"{today}-001.md").write_text("")
-        (tmp_path / f"{today}-002.md").write_text("")
+        (tmp_path / f"{today}-001.md").touch()
+        (tmp_path / f"{today}-002.md").touch()
 
         tid = generate_task_id(tmp_path)
         assert tid == f"{today}-003"
 
     def test_ignores_other_dates(self, tmp_path):
-        (tmp_path / "2025-01-01-005.md").write_text("")
+        (tmp_path / "2025-01-01-005.md").touch()
 
         tid = generate_task_id(tmp_path)
         today = date.today().isoformat()
         assert tid == f"{today}-001"
 
+    def test_ignores_result_files(self, tmp_path):
+        today = date.today().isoformat()
+        (tmp_path / f"{today}-001.md").touch()
+        (tmp_path / f"{today}-007.result.md").touch()
+
+        assert generate_task_id(tmp_path) == f"{today}-002"
+
     def test_nonexistent_dir(self, tmp_path):
         tid = generate_task_id(tmp_path / "does_not_exist")
         today = date.today().isoformat()
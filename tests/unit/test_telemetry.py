@@ -8,16 +8,37 @@ from data.dao_telemetry import (
     get_learner_events,
     get_learner_summary,
     insert_learner_event,
+    insert_learner_events_batch,
 )
-from data.db import init_schema
+from data.db import get_initialized_connection
+
+
+@pytest.fixture(scope="module")
+def _shared_conn():
+    c = get_initialized_connection(":memory:")
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def conn(_shared_conn):
+    """One schema for the module; rows are cleared after each test.
+
+    The DAO commits, which would release a SAVEPOINT, so tests are isolated
+    by deleting what they wrote instead of rolling back.
+    """
+    yield _shared_conn
+    _shared_conn.rollback()
+    with _shared_conn:
+        _shared_conn.execute("DELETE FROM learner_events")
 
 
 @pytest.fixture
-def conn():
-    c = sqlite3.connect(":memory:")
-    c.row_factory = sqlite3.Row
-    init_schema(c)
-    return c
+def conn_file(tmp_path):
+    """File-backed DB, so the WAL journal is actually used."""
+    c = get_initialized_connection(tmp_path / "t.db")
+    yield c
+    c.close()
 
 
 class TestInsertAndQuery:
@@ -56,22 +77,43 @@ class TestInsertAndQuery:
         assert len(events) == 1
         assert events[0]["event_type"] == "module_view"
 
+    def test_batch_insert_is_all_or_nothing(self, conn):
+        event = {"event_id": "e1", "cert_id": "c1", "learner_id": "L1",
+                 "event_type": "quiz_attempt", "t": "2026-01-01T00:00:00Z"}
+        with pytest.raises(sqlite3.IntegrityError):
+            insert_learner_events_batch(conn, [event, {**event, "t": "2026-01-02T00:00:00Z"}])
+        assert get_learner_events(conn, "c1") == []
+
+    def test_filtered_query_uses_composite_index(self, conn):
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM learner_events "
+            "WHERE cert_id = ? AND learner_id = ? AND event_type = ?",
+            ("c1", "L1", "quiz_attempt"),
+        ))
+        assert "USING INDEX idx_learner_events_learner_type" in plan
+
+    def test_file_db_uses_wal(self, conn_file):
+        assert conn_file.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn_file.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        insert_learner_event(conn_file, event_id="e1", cert_id="c1", learner_id="L1",
+                             event_type="quiz_attempt", t="2026-01-01T00:00:00Z")
+        assert len(get_learner_events(conn_file, "c1")) == 1
+
 
 class TestLearnerSummary:
     def test_summary_aggregation(self, conn):
-        # Quiz attempts
-        insert_learner_event(conn, event_id="e1", cert_id="c1", learner_id="L1",
-                             event_type="quiz_attempt", objective_id="obj-1",
-                             score=0.9, t="2026-01-01T00:00:00Z")
-        insert_learner_event(conn, event_id="e2", cert_id="c1", learner_id="L1",
-                             event_type="quiz_attempt", objective_id="obj-2",
-                             score=0.7, t="2026-01-02T00:00:00Z")
-        # Module view
-        insert_learner_event(conn, event_id="e3", cert_id="c1", learner_id="L1",
-                             event_type="module_view", t="2026-01-03T00:00:00Z")
-        # Lesson complete
-        insert_learner_event(conn, event_id="e4", cert_id="c1", learner_id="L1",
-                             event_type="lesson_complete", t="2026-01-04T00:00:00Z")
+        base = {"cert_id": "c1", "learner_id": "L1"}
+        insert_learner_events_batch(conn, [
+            # Quiz attempts
+            {**base, "event_id": "e1", "event_type": "quiz_attempt",
+             "objective_id": "obj-1", "score": 0.9, "t": "2026-01-01T00:00:00Z"},
+            {**base, "event_id": "e2", "event_type": "quiz_attempt",
+             "objective_id": "obj-2", "score": 0.7, "t": "2026-01-02T00:00:00Z"},
+            # Module view
+            {**base, "event_id": "e3", "event_type": "module_view", "t": "2026-01-03T00:00:00Z"},
+            # Lesson complete
+            {**base, "event_id": "e4", "event_type": "lesson_complete", "t": "2026-01-04T00:00:00Z"},
+        ])
 
         summary = get_learner_summary(conn, "c1", "L1")
         assert summary["total_events"] == 4
@@ -84,4 +126,6 @@ class TestLearnerSummary:
     def test_empty_summary(self, conn):
         summary = get_learner_summary(conn, "c1", "L1")
         assert summary["total_events"] == 0
+        assert summary["quiz_attempts"] == 0
         assert summary["avg_score"] is None
+        assert summary["objectives_attempted"] == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from unittest.mock import MagicMock, patch
 
@@ -19,31 +20,35 @@ from core.tiered_dispatch import TieredDispatcher
 
 # --- Helpers ---
 
+_TIER1_DEFAULTS = {
+    "intent": "analyze",
+    "requires_reasoning": True,
+    "complexity_score": 0.6,
+    "confidence": 0.5,
+    "recommended_tier": 2,
+    "action": "analyze",
+    "target": "",
+}
+
+_TIER2_DEFAULTS = {
+    "reasoning": "Analysis of the request",
+    "action": "analyze",
+    "target": "",
+    "quality_score": 0.85,
+    "reasoning_depth": 2,
+    "escalate": False,
+}
+
+
+# Overrides are scalars, so responses are memoized per distinct override set.
+@functools.lru_cache(maxsize=None)
 def _make_tier1_response(**overrides) -> str:
-    defaults = {
-        "intent": "analyze",
-        "requires_reasoning": True,
-        "complexity_score": 0.6,
-        "confidence": 0.5,
-        "recommended_tier": 2,
-        "action": "analyze",
-        "target": "",
-    }
-    defaults.update(overrides)
-    return json.dumps(defaults)
+    return json.dumps({**_TIER1_DEFAULTS, **overrides})
 
 
+@functools.lru_cache(maxsize=None)
 def _make_tier2_response(**overrides) -> str:
-    defaults = {
-        "reasoning": "Analysis of the request",
-        "action": "analyze",
-        "target": "",
-        "quality_score": 0.85,
-        "reasoning_depth": 2,
-        "escalate": False,
-    }
-    defaults.update(overrides)
-    return json.dumps(defaults)
+    return json.dumps({**_TIER2_DEFAULTS, **overrides})
 
 
 def _mock_call(response: str):
@@ -52,16 +57,42 @@ def _mock_call(response: str):
     return _call
 
 
+# --- Shared adapters ---
+# select_model never calls an adapter, so one instance of each serves every
+# router in the module; only the router and its criteria vary per test.
+
+@pytest.fixture(scope="module")
+def local_adapter():
+    from core.adapters import OllamaAdapter
+    return OllamaAdapter(name="local", model="test")
+
+
+@pytest.fixture(scope="module")
+def frontier_adapter():
+    from core.adapters import OllamaAdapter
+    return OllamaAdapter(name="frontier", model="frontier-test")
+
+
+def _router(local, frontier=None, **criteria) -> ModelRouter:
+    router = ModelRouter(escalation_criteria=EscalationCriteria(**criteria))
+    router.register_local(local)
+    if frontier is not None:
+        router.register_frontier(frontier)
+    return router
+
+
+_ESCALATION_POLICY = AgentPolicy(
+    allowed_local_models=["local"],
+    allowed_frontier_models=["frontier"],
+)
+
+
 # --- Orchestrator per-node model selection ---
 
 class TestOrchestratorRouterIntegration:
-    def test_router_selects_model_for_node(self):
+    def test_router_selects_model_for_node(self, local_adapter):
         """When a router is provided, _execute_node uses it to select model."""
-        from core.adapters import OllamaAdapter
-
-        adapter = OllamaAdapter(name="local", model="test")
-        router = ModelRouter()
-        router.register_local(adapter)
+        router = _router(local_adapter)
 
         policy = AgentPolicy(allowed_local_models=["local"])
         decision = router.select_model(policy, {})
@@ -69,38 +100,22 @@ class TestOrchestratorRouterIntegration:
         assert decision.model_name == "local"
         assert not decision.escalated
 
-    def test_router_escalation_with_signals(self):
+    def test_router_escalation_with_signals(self, local_adapter, frontier_adapter):
         """Router escalates when state contains escalation signals."""
-        from core.adapters import OllamaAdapter
-
-        adapter = OllamaAdapter(name="local", model="test")
-        frontier = OllamaAdapter(name="frontier", model="frontier-test")
-        router = ModelRouter(
-            escalation_criteria=EscalationCriteria(min_confidence=0.7),
-        )
-        router.register_local(adapter)
-        router.register_frontier(frontier)
+        router = _router(local_adapter, frontier_adapter, min_confidence=0.7)
 
-        policy = AgentPolicy(
-            allowed_local_models=["local"],
-            allowed_frontier_models=["frontier"],
-        )
         state = {"_last_confidence": 0.3}  # Below threshold
-        decision = router.select_model(policy, state)
+        decision = router.select_model(_ESCALATION_POLICY, state)
 
         assert decision.escalated
         assert decision.model_name == "frontier"
 
-    def test_backward_compat_no_router(self):
+    def test_backward_compat_no_router(self, local_adapter):
         """Without router, model_call is used directly (existing behavior)."""
-        from core.adapters import OllamaAdapter
-
         policy = AgentPolicy(allowed_local_models=["local"])
         # When router=None, orchestrator falls back to model_call param
         # This just tests that the select_model path works standalone
-        router = ModelRouter()
-        adapter = OllamaAdapter(name="local", model="test")
-        router.register_local(adapter)
+        router = _router(local_adapter)
         decision = router.select_model(policy, {})
         assert decision.model_name == "local"
 
@@ -108,14 +123,13 @@ class TestOrchestratorRouterIntegration:
 # --- Agent preferred_tier ---
 
 class TestAgentTierPreferences:
-    def test_qa_validator_tier_0(self):
-        assert QAValidatorAgent.POLICY.preferred_tier == 0
-
-    def test_ingestor_tier_1(self):
-        assert IngestorAgent.POLICY.preferred_tier == 1
-
-    def test_contradiction_tier_2(self):
-        assert ContradictionAgent.POLICY.preferred_tier == 2
+    @pytest.mark.parametrize("agent_cls, tier", [
+        (QAValidatorAgent, 0),
+        (IngestorAgent, 1),
+        (ContradictionAgent, 2),
+    ], ids=lambda v: getattr(v, "__name__", None))
+    def test_preferred_tier(self, agent_cls, tier):
+        assert agent_cls.POLICY.preferred_tier == tier
 
     def test_micro_router_has_tier_fields(self):
         policy = MicroRouterAgent.POLICY
@@ -146,52 +160,55 @@ class TestSameModelDifferentConfigs:
 
 # --- Tier 2 dispatch ---
 
+@pytest.fixture(scope="class")
+def base_registry():
+    # Dispatch only calls match(), so one registry serves the whole class.
+    reg = CommandRegistry()
+    register_defaults(reg)
+    return reg
+
+
 class TestTier2Dispatch:
-    def _dispatcher(self, tier1_resp: str, tier2_resp: str) -> TieredDispatcher:
-        reg = CommandRegistry()
-        register_defaults(reg)
+    def _dispatcher(
+        self, registry: CommandRegistry, tier1_resp: str, tier2_resp: str,
+    ) -> TieredDispatcher:
         return TieredDispatcher(
-            command_registry=reg,
+            command_registry=registry,
             tier1_model_call=_mock_call(tier1_resp),
             tier2_model_call=_mock_call(tier2_resp),
         )
 
-    def test_tier2_resolves_on_good_quality(self):
+    def test_tier2_resolves_on_good_quality(self, base_registry):
         """Tier 2 handles request when quality is above threshold."""
         tier1_resp = _make_tier1_response(recommended_tier=2, confidence=0.5)
         tier2_resp = _make_tier2_response(quality_score=0.85, escalate=False)
-        d = self._dispatcher(tier1_resp, tier2_resp)
+        d = self._dispatcher(base_registry, tier1_resp, tier2_resp)
         result = d.dispatch("explain the architecture")
         assert result.tier == 2
         assert result.confidence == 0.85
 
-    def test_tier2_escalates_on_low_quality(self):
+    def test_tier2_escalates_on_low_quality(self, base_registry):
         """Tier 2 escalates when quality is below threshold."""
         tier1_resp = _make_tier1_response(recommended_tier=2, confidence=0.5)
         tier2_resp = _make_tier2_response(quality_score=0.3, escalate=False)
-        d = self._dispatcher(tier1_resp, tier2_resp)
+        d = self._dispatcher(base_registry, tier1_resp, tier2_resp)
         result = d.dispatch("complex multi-doc synthesis")
         assert result.tier == -1  # escalated past all available tiers
 
-    def test_tier2_escalates_on_high_reasoning_depth(self):
+    def test_tier2_escalates_on_high_reasoning_depth(self, base_registry):
         """Tier 2 escalates when it flags escalate=true."""
         tier1_resp = _make_tier1_response(recommended_tier=2, confidence=0.5)
         tier2_resp = _make_tier2_response(
             quality_score=0.8, reasoning_depth=4, escalate=True,
         )
-        d = self._dispatcher(tier1_resp, tier2_resp)
+        d = self._dispatcher(base_registry, tier1_resp, tier2_resp)
         result = d.dispatch("deep reasoning needed")
         assert result.tier == -1
 
-    def test_tier2_handles_parse_failure(self):
+    def test_tier2_handles_parse_failure(self, base_registry):
         """Tier 2 returns None on parse failure, falls through."""
         tier1_resp = _make_tier1_response(recommended_tier=2, confidence=0.5)
-        d = TieredDispatcher(
-            command_registry=CommandRegistry(),
-            tier1_model_call=_mock_call(tier1_resp),
-            tier2_model_call=_mock_call("NOT JSON"),
-        )
-        register_defaults(d.command_registry)
+        d = self._dispatcher(base_registry, tier1_resp, "NOT JSON")
         result = d.dispatch("something")
         assert result.tier == -1
 
@@ -199,37 +216,17 @@ class TestTier2Dispatch:
 # --- Escalation signal injection ---
 
 class TestEscalationSignals:
-    def test_confidence_signal_triggers_escalation(self):
-        router = ModelRouter(
-            escalation_criteria=EscalationCriteria(min_confidence=0.7),
-        )
-        from core.adapters import OllamaAdapter
-        router.register_local(OllamaAdapter(name="local", model="test"))
-        router.register_frontier(OllamaAdapter(name="frontier", model="test"))
-
-        policy = AgentPolicy(
-            allowed_local_models=["local"],
-            allowed_frontier_models=["frontier"],
-        )
+    def test_confidence_signal_triggers_escalation(self, local_adapter, frontier_adapter):
+        router = _router(local_adapter, frontier_adapter, min_confidence=0.7)
         # Simulate agent injecting confidence signal
         state = {"_last_confidence": 0.4}
-        decision = router.select_model(policy, state)
+        decision = router.select_model(_ESCALATION_POLICY, state)
         assert decision.escalated
 
-    def test_missing_citations_signal(self):
-        router = ModelRouter(
-            escalation_criteria=EscalationCriteria(max_missing_citations=2),
-        )
-        from core.adapters import OllamaAdapter
-        router.register_local(OllamaAdapter(name="local", model="test"))
-        router.register_frontier(OllamaAdapter(name="frontier", model="test"))
-
-        policy = AgentPolicy(
-            allowed_local_models=["local"],
-            allowed_frontier_models=["frontier"],
-        )
+    def test_missing_citations_signal(self, local_adapter, frontier_adapter):
+        router = _router(local_adapter, frontier_adapter, max_missing_citations=2)
         state = {"_missing_citations_count": 5}
-        decision = router.select_model(policy, state)
+        decision = router.select_model(_ESCALATION_POLICY, state)
         assert decision.escalated
         assert "missing citations" in decision.reason
 
@@ -7,7 +7,8 @@ import pytest
 from automation.validator import ValidationError, validate_result, validate_task
 
 # ---------------------------------------------------------------------------
-# Fixtures — valid file contents
+# Fixtures — valid file contents, encoded once; variants are derived with
+# bytes.replace at collection time and written with write_bytes.
 # ---------------------------------------------------------------------------
 
 VALID_TASK = textwrap.dedent("""\
@@ -33,7 +34,7 @@ VALID_TASK = textwrap.dedent("""\
     ## SUCCESS CRITERIA
 
     All flows covered.
-""")
+""").encode("utf-8")
 
 VALID_RESULT_COMPLETE = textwrap.dedent("""\
     # RESULT_FOR: 2026-02-17-001
@@ -58,7 +59,7 @@ VALID_RESULT_COMPLETE = textwrap.dedent("""\
     ### Suggested_Followups
 
     Implement the auth module.
-""")
+""").encode("utf-8")
 
 VALID_RESULT_FAILED = textwrap.dedent("""\
     # RESULT_FOR: 2026-02-17-001
@@ -83,7 +84,7 @@ VALID_RESULT_FAILED = textwrap.dedent("""\
     ### Suggested_Followups
 
     Provide more context and retry.
-""")
+""").encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -94,76 +95,56 @@ VALID_RESULT_FAILED = textwrap.dedent("""\
 class TestValidateTask:
     def test_valid_task_no_errors(self, tmp_path):
         f = tmp_path / "2026-02-17-001.md"
-        f.write_text(VALID_TASK)
+        f.write_bytes(VALID_TASK)
 
         errors = validate_task(f)
         assert errors == []
 
     def test_task_id_filename_mismatch(self, tmp_path):
         f = tmp_path / "wrong-name.md"
-        f.write_text(VALID_TASK)
+        f.write_bytes(VALID_TASK)
 
         errors = validate_task(f)
         fields = {e.field for e in errors}
         assert "TASK_ID" in fields
 
     def test_invalid_mode(self, tmp_path):
-        text = VALID_TASK.replace("MODE: PREMIUM", "MODE: TURBO")
         f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
+        f.write_bytes(VALID_TASK.replace(b"MODE: PREMIUM", b"MODE: TURBO"))
 
         errors = validate_task(f)
         msgs = [e.message for e in errors if e.field == "MODE"]
         assert any("TURBO" in m for m in msgs)
 
-    def test_invalid_task_type(self, tmp_path):
-        text = VALID_TASK.replace("TASK_TYPE: ARCHITECTURE", "TASK_TYPE: BUILD")
+    @pytest.mark.parametrize("content, field", [
+        pytest.param(
+            VALID_TASK.replace(b"TASK_TYPE: ARCHITECTURE", b"TASK_TYPE: BUILD"),
+            "TASK_TYPE", id="invalid_task_type",
+        ),
+        pytest.param(
+            VALID_TASK.replace(b"PRIORITY: HIGH", b"PRIORITY: URGENT"),
+            "PRIORITY", id="invalid_priority",
+        ),
+        pytest.param(
+            VALID_TASK.replace(b"OUTPUT_FORMAT: MARKDOWN", b"OUTPUT_FORMAT: HTML"),
+            "OUTPUT_FORMAT", id="invalid_output_format",
+        ),
+        pytest.param(
+            VALID_TASK.replace(b"CREATED_AT: 2026-02-17T10:00:00", b"CREATED_AT: not-a-date"),
+            "CREATED_AT", id="invalid_created_at",
+        ),
+        pytest.param(
+            VALID_TASK.replace(b"## CONSTRAINTS\n\nStandard library only.\n\n", b""),
+            "CONSTRAINTS", id="missing_section",
+        ),
+    ])
+    def test_invalid_field(self, tmp_path, content, field):
         f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
+        f.write_bytes(content)
 
         errors = validate_task(f)
         fields = {e.field for e in errors}
-        assert "TASK_TYPE" in fields
-
-    def test_invalid_priority(self, tmp_path):
-        text = VALID_TASK.replace("PRIORITY: HIGH", "PRIORITY: URGENT")
-        f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
-
-        errors = validate_task(f)
-        fields = {e.field for e in errors}
-        assert "PRIORITY" in fields
-
-    def test_invalid_output_format(self, tmp_path):
-        text = VALID_TASK.replace("OUTPUT_FORMAT: MARKDOWN", "OUTPUT_FORMAT: HTML")
-        f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
-
-        errors = validate_task(f)
-        fields = {e.field for e in errors}
-        assert "OUTPUT_FORMAT" in fields
-
-    def test_invalid_created_at(self, tmp_path):
-        text = VALID_TASK.replace("CREATED_AT: 2026-02-17T10:00:00", "CREATED_AT: not-a-date")
-        f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
-
-        errors = validate_task(f)
-        fields = {e.field for e in errors}
-        assert "CREATED_AT" in fields
-
-    def test_missing_section(self, tmp_path):
-        # Remove the CONSTRAINTS section
-        text = VALID_TASK.replace(
-            "## CONSTRAINTS\n\nStandard library only.\n\n",
-            "",
-        )
-        f = tmp_path / "2026-02-17-001.md"
-        f.write_text(text)
-
-        errors = validate_task(f)
-        fields = {e.field for e in errors}
-        assert "CONSTRAINTS" in fields
+        assert field in fields
 
 
 # ---------------------------------------------------------------------------
@@ -174,102 +155,60 @@ class TestValidateTask:
 class TestValidateResult:
     def test_valid_complete_result(self, tmp_path):
         f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(VALID_RESULT_COMPLETE)
+        f.write_bytes(VALID_RESULT_COMPLETE)
 
         errors = validate_result(f)
         assert errors == []
 
     def test_valid_failed_result(self, tmp_path):
         f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(VALID_RESULT_FAILED)
+        f.write_bytes(VALID_RESULT_FAILED)
 
         errors = validate_result(f)
         assert errors == []
 
-    def test_missing_output_section_on_complete(self, tmp_path):
-        text = VALID_RESULT_COMPLETE.replace(
-            "## OUTPUT\n\nHere is the architecture document.\n\n",
-            "",
-        )
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "OUTPUT" in fields
-
-    def test_empty_output_section_on_complete(self, tmp_path):
-        text = VALID_RESULT_COMPLETE.replace(
-            "Here is the architecture document.",
-            "",
-        )
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "OUTPUT" in fields
-
-    def test_missing_error_section_on_failed(self, tmp_path):
-        text = VALID_RESULT_FAILED.replace(
-            "## ERROR\n\nCould not process: insufficient context provided.\n\n",
-            "",
-        )
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "ERROR" in fields
-
-    def test_missing_meta_subsection(self, tmp_path):
-        # Remove the Risks subsection
-        text = VALID_RESULT_COMPLETE.replace(
-            "### Risks\n\nMay need caching later.\n\n",
-            "",
-        )
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "META.Risks" in fields
-
-    def test_missing_required_header(self, tmp_path):
-        text = VALID_RESULT_COMPLETE.replace("# STATUS: COMPLETE\n", "")
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "STATUS" in fields
-
-    def test_invalid_status(self, tmp_path):
-        text = VALID_RESULT_COMPLETE.replace("STATUS: COMPLETE", "STATUS: PARTIAL")
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "STATUS" in fields
-
-    def test_invalid_quality_level(self, tmp_path):
-        text = VALID_RESULT_COMPLETE.replace("QUALITY_LEVEL: HIGH", "QUALITY_LEVEL: EXCELLENT")
-        f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
-
-        errors = validate_result(f)
-        fields = {e.field for e in errors}
-        assert "QUALITY_LEVEL" in fields
-
-    def test_invalid_completed_at(self, tmp_path):
-        text = VALID_RESULT_COMPLETE.replace(
-            "COMPLETED_AT: 2026-02-17T12:00:00",
-            "COMPLETED_AT: yesterday",
-        )
+    @pytest.mark.parametrize("content, field", [
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(b"## OUTPUT\n\nHere is the architecture document.\n\n", b""),
+            "OUTPUT", id="missing_output_section_on_complete",
+        ),
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(b"Here is the architecture document.", b""),
+            "OUTPUT", id="empty_output_section_on_complete",
+        ),
+        pytest.param(
+            VALID_RESULT_FAILED.replace(
+                b"## ERROR\n\nCould not process: insufficient context provided.\n\n", b"",
+            ),
+            "ERROR", id="missing_error_section_on_failed",
+        ),
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(b"### Risks\n\nMay need caching later.\n\n", b""),
+            "META.Risks", id="missing_meta_subsection",
+        ),
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(b"# STATUS: COMPLETE\n", b""),
+            "STATUS", id="missing_required_header",
+        ),
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(b"STATUS: COMPLETE", b"STATUS: PARTIAL"),
+            "STATUS", id="invalid_status",
+        ),
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(b"QUALITY_LEVEL: HIGH", b"QUALITY_LEVEL: EXCELLENT"),
+            "QUALITY_LEVEL", id="invalid_quality_level",
+        ),
+        pytest.param(
+            VALID_RESULT_COMPLETE.replace(
+                b"COMPLETED_AT: 2026-02-17T12:00:00", b"COMPLETED_AT: yesterday",
+            ),
+            "COMPLETED_AT", id="invalid_completed_at",
+        ),
+    ])
+    def test_invalid_field(self, tmp_path, content, field):
         f = tmp_path / "2026-02-17-001.result.md"
-        f.write_text(text)
+        f.write_bytes(content)
 
         errors = validate_result(f)
         fields = {e.field for e in errors}
-        assert "COMPLETED_AT" in fields
+        assert field in fields
@@ -1,39 +1,44 @@
 """Tests for publisher versioning scheme."""
 
-import shutil
-from pathlib import Path
-
 import pytest
 
 from agents.publisher_agent import auto_version, _next_semver, _date_version, _suite_version
 
-TMP_ROOT = Path("publish/out/_test_versioning")
-
-
-@pytest.fixture(autouse=True)
-def cleanup():
-    yield
-    if TMP_ROOT.exists():
-        shutil.rmtree(TMP_ROOT)
+@pytest.fixture
+def cert_dir(tmp_path):
+    """Publish dir for cert aws-101 under a per-test publish root."""
+    base = tmp_path / "cert" / "aws-101"
+    base.mkdir(parents=True)
+    return base
 
 
 class TestSemver:
-    def test_first_publish(self):
-        assert _next_semver(TMP_ROOT, "cert", "aws-101") == "1.0.0"
+    def test_first_publish(self, tmp_path):
+        assert _next_semver(tmp_path, "cert", "aws-101") == "1.0.0"
 
-    def test_increments_minor(self):
-        (TMP_ROOT / "cert" / "aws-101" / "1.0.0").mkdir(parents=True)
-        assert _next_semver(TMP_ROOT, "cert", "aws-101") == "1.1.0"
+    def test_increments_minor(self, tmp_path, cert_dir):
+        (cert_dir / "1.0.0").mkdir()
+        assert _next_semver(tmp_path, "cert", "aws-101") == "1.1.0"
 
-    def test_picks_latest(self):
+    def test_picks_latest(self, tmp_path, cert_dir):
         for v in ("1.0.0", "1.1.0", "1.2.0"):
-            (TMP_ROOT / "cert" / "aws-101" / v).mkdir(parents=True)
-        assert _next_semver(TMP_ROOT, "cert", "aws-101") == "1.3.0"
+            (cert_dir / v).mkdir()
+        assert _next_semver(tmp_path, "cert", "aws-101") == "1.3.0"
+
+    def test_ignores_non_semver_dirs(self, tmp_path, cert_dir):
+        (cert_dir / "draft").mkdir()
+        (cert_dir / "1.0.0").mkdir()
+        assert _next_semver(tmp_path, "cert", "aws-101") == "1.1.0"
+
+    def test_ignores_semver_named_files(self, tmp_path, cert_dir):
+        (cert_dir / "1.0.0").mkdir()
+        (cert_dir / "9.9.9").write_text("")
+        assert _next_semver(tmp_path, "cert", "aws-101") == "1.1.0"
 
-    def test_ignores_non_semver_dirs(self):
-        (TMP_ROOT / "cert" / "aws-101" / "draft").mkdir(parents=True)
-        (TMP_ROOT / "cert" / "aws-101" / "1.0.0").mkdir(parents=True)
-        assert _next_semver(TMP_ROOT, "cert", "aws-101") == "1.1.0"
+    def test_compares_numerically(self, tmp_path, cert_dir):
+        for v in ("1.9.0", "1.10.0"):
+            (cert_dir / v).mkdir()
+        assert _next_semver(tmp_path, "cert", "aws-101") == "1.11.0"
 
 
 class TestDateVersion:
@@ -61,8 +66,8 @@ class TestSuiteVersion:
 
 
 class TestAutoVersion:
-    def test_cert_gets_semver(self):
-        v = auto_version("cert", {"scope_id": "aws-101"}, publish_root=TMP_ROOT)
+    def test_cert_gets_semver(self, tmp_path):
+        v = auto_version("cert", {"scope_id": "aws-101"}, publish_root=tmp_path)
         assert v == "1.0.0"
 
     def test_topic_gets_date(self):
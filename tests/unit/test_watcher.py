@@ -1,13 +1,15 @@
 """Tests for the automation watcher service."""
 
 import json
+import os
 import textwrap
 from pathlib import Path
 
 import pytest
 
+from automation import logging as automation_logging
 from automation.config import AutomationConfig, PathsConfig
-from automation.queue import QueueState, add_pending, load_queue, move_to_processing, save_queue
+from automation.queue import QueueState, save_queue
 from automation.watcher import watch_once
 
 VALID_RESULT = textwrap.dedent("""\
@@ -41,97 +43,101 @@ INVALID_RESULT = textwrap.dedent("""\
     # COMPLETED_AT: 2026-02-17T12:00:00
 """)
 
+# Split at {task_id} and encoded once; tests write the joined bytes.
+_VALID_PRE, _VALID_POST = (p.encode("utf-8") for p in VALID_RESULT.split("{task_id}", 1))
+_INVALID_PRE, _INVALID_POST = (p.encode("utf-8") for p in INVALID_RESULT.split("{task_id}", 1))
 
-def _setup(tmp_path) -> AutomationConfig:
-    paths = PathsConfig(
-        base=str(tmp_path / "auto"),
-        tasks=str(tmp_path / "auto" / "tasks"),
-        processing=str(tmp_path / "auto" / "processing"),
-        outputs=str(tmp_path / "auto" / "outputs"),
-        archive=str(tmp_path / "auto" / "archive"),
-        logs=str(tmp_path / "auto" / "logs"),
-        schemas=str(tmp_path / "auto" / "schemas"),
-    )
-    cfg = AutomationConfig(paths=paths)
-    for d in [paths.base, paths.tasks, paths.processing, paths.outputs,
+
+def _valid(task_id: str) -> bytes:
+    return _VALID_PRE + task_id.encode("ascii") + _VALID_POST
+
+
+def _invalid(task_id: str) -> bytes:
+    return _INVALID_PRE + task_id.encode("ascii") + _INVALID_POST
+
+
+@pytest.fixture(scope="module")
+def cfg(tmp_path_factory) -> AutomationConfig:
+    """Directory tree built once; _reset restores it before each test."""
+    base = tmp_path_factory.mktemp("auto")
+    paths = PathsConfig.from_base(base)
+    for d in [paths.tasks, paths.processing, paths.outputs,
               paths.archive, paths.logs, paths.schemas]:
-        Path(d).mkdir(parents=True, exist_ok=True)
-    save_queue(tmp_path / "auto" / "queue.json", QueueState())
-    return cfg
+        Path(d).mkdir()
+    return AutomationConfig(paths=paths)
 
 
-def _add_processing_task(cfg, task_id):
-    """Add a task directly to the processing list."""
-    qp = Path(cfg.paths.base) / "queue.json"
-    state = load_queue(qp)
-    add_pending(state, task_id)
-    move_to_processing(state, task_id)
-    save_queue(qp, state)
+@pytest.fixture(autouse=True)
+def _reset(cfg):
+    """Drop files left in outputs/ and logs/.
 
+    Every test writes its own queue.json via _add_processing_task.
+    """
+    for d in (cfg.paths.outputs, cfg.paths.logs):
+        with os.scandir(d) as it:
+            for entry in it:
+                os.unlink(entry.path)
 
-class TestWatchOnce:
-    def test_detects_new_result_and_completes(self, tmp_path):
-        cfg = _setup(tmp_path)
-        task_id = "2026-02-17-001"
-        _add_processing_task(cfg, task_id)
 
-        # Write valid result
-        result_path = Path(cfg.paths.outputs) / f"{task_id}.result.md"
-        result_path.write_text(VALID_RESULT.format(task_id=task_id))
+@pytest.fixture(scope="module")
+def queue_path(cfg) -> Path:
+    return Path(cfg.paths.base) / "queue.json"
+
 
-        processed = watch_once(cfg)
+def _add_processing_task(queue_path, task_id):
+    """Write a queue holding only task_id, already in processing."""
+    save_queue(queue_path, QueueState(processing=[task_id]))
 
-        assert task_id in processed
-        state = load_queue(Path(cfg.paths.base) / "queue.json")
-        assert task_id in state.completed
-        assert task_id not in state.processing
 
-    def test_marks_failed_on_validation_error(self, tmp_path):
-        cfg = _setup(tmp_path)
-        task_id = "2026-02-17-002"
-        _add_processing_task(cfg, task_id)
+class TestWatchOnce:
+    @pytest.mark.parametrize("body_fn, bucket", [
+        pytest.param(_valid, "completed", id="valid_result_completes"),
+        # Missing QUALITY_LEVEL, OUTPUT, META
+        pytest.param(_invalid, "failed", id="invalid_result_fails"),
+    ])
+    def test_moves_processed_task(self, cfg, queue_path, body_fn, bucket):
+        task_id = "2026-02-17-001"
+        _add_processing_task(queue_path, task_id)
 
-        # Write invalid result (missing QUALITY_LEVEL, OUTPUT, META)
         result_path = Path(cfg.paths.outputs) / f"{task_id}.result.md"
-        result_path.write_text(INVALID_RESULT.format(task_id=task_id))
+        result_path.write_bytes(body_fn(task_id))
 
-        processed = watch_once(cfg)
+        result = watch_once(cfg)
 
-        assert task_id in processed
-        state = load_queue(Path(cfg.paths.base) / "queue.json")
-        assert task_id in state.failed
-        assert task_id not in state.processing
+        assert task_id in result.processed
+        assert task_id in getattr(result.state, bucket)
+        assert task_id not in result.state.processing
 
-    def test_ignores_already_processed(self, tmp_path):
-        cfg = _setup(tmp_path)
+    def test_ignores_already_processed(self, cfg, queue_path):
         task_id = "2026-02-17-003"
-        _add_processing_task(cfg, task_id)
+        _add_processing_task(queue_path, task_id)
 
         result_path = Path(cfg.paths.outputs) / f"{task_id}.result.md"
-        result_path.write_text(VALID_RESULT.format(task_id=task_id))
+        result_path.write_bytes(_valid(task_id))
 
         # First poll picks it up
-        first = watch_once(cfg)
+        first = watch_once(cfg).processed
         assert task_id in first
 
         # Second poll skips it
-        second = watch_once(cfg)
+        second = watch_once(cfg).processed
         assert task_id not in second
 
-    def test_logs_structured_entries(self, tmp_path):
-        cfg = _setup(tmp_path)
+    def test_logs_structured_entries(self, cfg, queue_path, monkeypatch):
+        monkeypatch.setattr(automation_logging, "_now", lambda: "2026-02-17T12:00:00+00:00")
         task_id = "2026-02-17-004"
-        _add_processing_task(cfg, task_id)
+        _add_processing_task(queue_path, task_id)
 
         result_path = Path(cfg.paths.outputs) / f"{task_id}.result.md"
-        result_path.write_text(VALID_RESULT.format(task_id=task_id))
+        result_path.write_bytes(_valid(task_id))
 
         watch_once(cfg)
 
         log_path = Path(cfg.paths.logs) / "system.log"
         assert log_path.exists()
-        lines = log_path.read_text().strip().splitlines()
-        entries = [json.loads(line) for line in lines]
+        # NDJSON -> one JSON array, parsed in a single call.
+        raw = log_path.read_bytes().rstrip(b"\n").replace(b"\n", b",")
+        entries = json.loads(b"[" + raw + b"]")
 
         actions = [e["action"] for e in entries]
         assert "task_completed" in actions
@@ -139,6 +145,6 @@ class TestWatchOnce:
 
         # Each entry has required fields
         for entry in entries:
-            assert "timestamp" in entry
+            assert entry["timestamp"] == "2026-02-17T12:00:00+00:00"
             assert "action" in entry
             assert "status" in entry